@@ -23,7 +23,6 @@ from __future__ import annotations
 
 import logging
 import os
-import secrets
 from datetime import timedelta
 from typing import Any, Dict
 
@@ -32,6 +31,7 @@ import werkzeug
 
 from storage.sqlite import init_db, get_user
 from web.auth import bp as auth_bp
+from web.helpers import get_csrf_token
 from web.api import bp as api_bp
 from web.views import bp as views_bp
 
@@ -108,19 +108,12 @@ def create_app() -> Flask:
         if not sent or not expected or sent != expected:
             abort(400)
 
-    def _get_csrf_token() -> str:
-        token = session.get("csrf_token")
-        if not token:
-            token = secrets.token_urlsafe(24)
-            session["csrf_token"] = token
-        return token
-
     @app.context_processor
     def _inject_user() -> Dict[str, Any]:
         """Make ``user`` available in every template."""
         return {
             "user": getattr(g, "user", None),
-            "csrf_token": _get_csrf_token(),
+            "csrf_token": get_csrf_token(),
         }
 
     # -- Security response headers -----------------------------------------
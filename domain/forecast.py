@@ -2,18 +2,31 @@
 
 from __future__ import annotations
 
+import copy
+import heapq
 import logging
 import math
 import re
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime, timedelta
+from operator import itemgetter
 from typing import Any, Dict, List, Optional, Tuple
 
-from zoneinfo import ZoneInfo
 
 from locations import get_fallback_conditions, get_monthly_water_temps
 
-from services.astro import _sun_times, compute_lunar_details, compute_solunar_times, compute_twilight_times
+from services.astro import (
+    _sun_times,
+    compute_lunar_details,
+    compute_solunar_times,
+    compute_twilight_times,
+    format_clock_time,
+    safe_zone,
+)
+from services.http_client import UPSTREAM_CONCURRENCY
 from services.ndbc import (
     NDBC_STATIONS,
     _try_ndbc_station,
@@ -33,7 +46,10 @@ from services.noaa import (
 )
 from services.nws import (
     NWS_MARINE_ZONE,
+    _MPH_RE,
     _MPH_TO_KNOTS,
+    _SEA_HEIGHT_RE,
+    _WIND_SPEED_RE,
     _try_nws_forecast,
     _try_nws_gridpoint,
     _fetch_nws_extended,
@@ -44,8 +60,10 @@ from services.nws import (
 )
 from domain.species import (
     SPECIES_DB,
+    _CONDITION_FLAGS,
+    _base_scores,
+    _conditions_table,
     _get_technique_tip,
-    _score_species,
     _species_matches_profile,
     build_bait_ranking,
     build_natural_bait_chart,
@@ -58,18 +76,6 @@ logger = logging.getLogger(__name__)
 
 FORECAST_VERSION = "v1.0.0"
 
-_DEFAULT_TZ = "America/New_York"
-
-
-def _safe_zone(tz_name: str) -> ZoneInfo:
-    """Return ZoneInfo for *tz_name*, falling back to Eastern if it's invalid."""
-    try:
-        return ZoneInfo(tz_name)
-    except (KeyError, Exception):
-        if tz_name != _DEFAULT_TZ:
-            logger.warning("Invalid timezone %r in location data; using %s", tz_name, _DEFAULT_TZ)
-        return ZoneInfo(_DEFAULT_TZ)
-
 # Generic mid-Atlantic historical monthly averages used as the absolute
 # last resort when no location is set.
 MONTHLY_AVG_WIND: Dict[int, Tuple[float, float]] = {
@@ -96,6 +102,14 @@ _DIR_MAP: Dict[str, str] = {
     "east": "E", "west": "W",
 }
 
+# Wind direction in marine zone text.  Unlike parse_conditions, the outlook
+# does not report "VARIABLE" as a direction.
+_OUTLOOK_WIND_DIR_RE = re.compile(
+    r"(north(?:east|west)?|south(?:east|west)?|east|west"
+    r"|NE|NW|SE|SW|N|E|S|W)\s+wind",
+    re.IGNORECASE,
+)
+
 # -- Source 5: Seasonal averages (ALWAYS succeeds) --------------------------
 
 def _seasonal_averages(month: int) -> Tuple[Tuple[float, float], Tuple[float, float], str]:
@@ -335,7 +349,7 @@ class AstronomyService(ExternalDataService):
         )
         sunrise, sunset = values
         if sunrise and sunset:
-            return sunrise, sunset, f"{sunrise.strftime('%-I:%M %p')} / {sunset.strftime('%-I:%M %p')}"
+            return sunrise, sunset, f"{format_clock_time(sunrise)} / {format_clock_time(sunset)}"
         return None, None, "Unavailable"
 
     def get_solunar_times(self, now: datetime, lat: float, lng: float, tz_name: str) -> Dict[str, Any]:
@@ -526,7 +540,7 @@ def build_multiday_outlook(
     loc_lng = (location or {}).get("lng", _LNG)
     loc_zone = (location or {}).get("nws_zone", "")
     tz_name = (location or {}).get("timezone", "America/New_York")
-    tz = _safe_zone(tz_name)
+    tz = safe_zone(tz_name)
 
     # Try NWS extended forecast for wind data; falls back to marine zone
     # forecast (loc_zone) for offshore/pier coordinates where the gridpoint
@@ -584,7 +598,7 @@ def build_multiday_outlook(
             ws = day_period.get("windSpeed", "")
             wd = day_period.get("windDirection", "")
             wind_dir_day = wd or ""
-            m = re.search(r"(\d+)(?:\s*to\s*(\d+))?\s*mph", ws, re.IGNORECASE)
+            m = _MPH_RE.search(ws)
             if m:
                 low_mph = float(m.group(1))
                 high_mph = float(m.group(2)) if m.group(2) else low_mph
@@ -596,20 +610,13 @@ def build_multiday_outlook(
                 # Marine zone periods report wind in knots inside detailedForecast
                 # text rather than in a separate windSpeed field.
                 marine_text = day_period.get("detailedForecast", "")
-                kt_m = re.search(
-                    r"(\d+)(?:\s*to\s*(\d+))?\s*(?:kt|knots?)",
-                    marine_text, re.IGNORECASE,
-                )
+                kt_m = _WIND_SPEED_RE.search(marine_text)
                 if kt_m:
                     low_kt = round(float(kt_m.group(1)))
                     high_kt = round(float(kt_m.group(2))) if kt_m.group(2) else low_kt
                     wind_range = (low_kt, high_kt)
                     if not wd:
-                        dir_m = re.search(
-                            r"(north(?:east|west)?|south(?:east|west)?|east|west"
-                            r"|NE|NW|SE|SW|N|E|S|W)\s+wind",
-                            marine_text, re.IGNORECASE,
-                        )
+                        dir_m = _OUTLOOK_WIND_DIR_RE.search(marine_text)
                         if dir_m:
                             raw = dir_m.group(1)
                             wd = _DIR_MAP.get(raw.lower(), raw.upper())
@@ -635,11 +642,7 @@ def build_multiday_outlook(
         wave_range = None
         if day_period:
             marine_text = day_period.get("detailedForecast", "")
-            sea_match = re.search(
-                r"(?:seas?|waves?)\s*(?:around\s+)?(\d+)(?:\s*to\s*(\d+))?\s*(?:ft|feet|foot)",
-                marine_text,
-                re.IGNORECASE,
-            )
+            sea_match = _SEA_HEIGHT_RE.search(marine_text)
             if sea_match:
                 low_ft = float(sea_match.group(1))
                 high_ft = float(sea_match.group(2)) if sea_match.group(2) else low_ft
@@ -704,25 +707,23 @@ def build_multiday_outlook(
         outlook_fish_region = (location or {}).get("fish_region", "")
         top_species_names: List[str] = []
         species_scores: List[Tuple[str, float]] = []
-        for sp in SPECIES_DB:
-            if sp.get("coast", "east") != coast:
+        conditions = _conditions_table(None, wind_range, wave_range, 12, wind_coast)
+        base_floor = 20 - max(conditions)
+        for i, base in _base_scores(future_month, future_water_temp, coast):
+            if base <= base_floor:
                 continue
+            sp = SPECIES_DB[i]
             if outlook_fish_region and "regions" in sp and outlook_fish_region not in sp["regions"]:
                 continue
-            if not _species_matches_profile(sp["name"], fishing_types, targets):
+            name = sp["name"]
+            if not _species_matches_profile(name, fishing_types, targets):
                 continue
-            s = _score_species(
-                sp, future_month, future_water_temp,
-                wind_dir=None,
-                wind_range=wind_range,
-                wave_range=wave_range,
-                hour=12,
-                coast=wind_coast,
-            )
+            s = base + conditions[_CONDITION_FLAGS[name]]
             if s > 20:
-                species_scores.append((sp["name"], s))
-        species_scores.sort(key=lambda x: x[1], reverse=True)
-        top_species_names = [name for name, _ in species_scores[:5]]
+                species_scores.append((name, s))
+        top_species_names = [
+            name for name, _ in heapq.nlargest(5, species_scores, key=itemgetter(1))
+        ]
 
         days.append({
             "day": day_label,
@@ -1281,7 +1282,7 @@ def recompute_current_uv(location: Optional[Dict[str, Any]] = None) -> Dict[str,
     location, not the moment the forecast was originally generated.
     """
     tz_name = (location or {}).get("timezone", "America/New_York")
-    tz = _safe_zone(tz_name)
+    tz = safe_zone(tz_name)
     now = datetime.now(tz)
     lat = (location or {}).get("lat", _LAT)
     lng = (location or {}).get("lng", _LNG)
@@ -1436,6 +1437,23 @@ def _seasonality_highlights(forecast: Dict[str, Any]) -> List[Dict[str, str]]:
     return highlights
 
 
+# Marine-conditions fetches for every forecast build in this process share
+# one bounded executor, sized to the HTTP client's connection pool.  Each
+# build holds a single worker (the building thread fetches water temperature
+# itself), so builds running together do not queue behind each other.
+_upstream_pool = ThreadPoolExecutor(max_workers=UPSTREAM_CONCURRENCY, thread_name_prefix="forecast-fetch")
+
+# Location id -> future for the forecast being generated for it right now,
+# and how many callers joined it (only then does the result need a snapshot).
+_inflight_lock = threading.Lock()
+_inflight: Dict[str, Future] = {}
+_inflight_waiters: Dict[str, int] = {}
+
+# How long a coalesced caller waits on another caller's build before giving
+# up; a leader stuck behind retrying upstreams must not pin every request.
+COALESCE_WAIT_SECONDS = 30
+
+
 def generate_forecast(
     location: Optional[Dict[str, Any]] = None,
     profile: Optional[Dict[str, Any]] = None,
@@ -1449,9 +1467,60 @@ def generate_forecast(
 
     If ``profile`` is provided (from user's fishing profile), species are
     filtered to match the user's fishing style and target preferences.
+
+    Concurrent calls for the same location (a page-load cache miss racing
+    the background refresh, say) are coalesced: the first caller builds the
+    forecast and the others wait for it and get their own copy, so the
+    upstream APIs are queried once.  A waiter whose leader takes longer
+    than ``COALESCE_WAIT_SECONDS`` gets a ``TimeoutError``, which callers
+    already handle like any other failed build.
     """
+    location_id = (location or {}).get("id", "")
+    if profile is not None or not location_id:
+        return _build_forecast(location, profile)
+
+    with _inflight_lock:
+        future = _inflight.get(location_id)
+        leader = future is None
+        if leader:
+            future = _inflight[location_id] = Future()
+            _inflight_waiters[location_id] = 0
+        else:
+            _inflight_waiters[location_id] += 1
+    if not leader:
+        logger.info("forecast.coalesced location_id=%s", location_id)
+        try:
+            return copy.deepcopy(future.result(timeout=COALESCE_WAIT_SECONDS))
+        except FutureTimeoutError:
+            logger.warning(
+                "forecast.coalesce_timeout location_id=%s waited_s=%s",
+                location_id, COALESCE_WAIT_SECONDS,
+            )
+            raise TimeoutError(f"forecast build for {location_id} still running") from None
+
+    try:
+        forecast = _build_forecast(location, profile)
+    except BaseException as exc:
+        with _inflight_lock:
+            del _inflight[location_id]
+            del _inflight_waiters[location_id]
+        future.set_exception(exc)
+        raise
+    # Nobody can join once the entry is gone, so the waiter count is final.
+    with _inflight_lock:
+        del _inflight[location_id]
+        waiters = _inflight_waiters.pop(location_id)
+    # Waiters copy from a snapshot, so the caller may mutate its result.
+    future.set_result(copy.deepcopy(forecast) if waiters else None)
+    return forecast
+
+
+def _build_forecast(
+    location: Optional[Dict[str, Any]],
+    profile: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
     tz_name = (location or {}).get("timezone", "America/New_York")
-    tz = _safe_zone(tz_name)
+    tz = safe_zone(tz_name)
     now = datetime.now(tz)
     month = now.month
     builder = ForecastBuilder()
@@ -1461,18 +1530,35 @@ def generate_forecast(
     started = time.perf_counter()
     logger.info("forecast.start location_id=%s forecast_version=%s", location_id, FORECAST_VERSION)
 
-    wind_range, wave_range, wind_dir = builder.marine_service.get_marine_forecast(
-        month,
-        location,
-        sources_used=sources_used,
-        fallbacks_triggered=fallbacks_triggered,
-    )
-    water_temp, temp_is_live = get_water_temp(
+    loc_lat = (location or {}).get("lat", _LAT)
+    loc_lng = (location or {}).get("lng", _LNG)
+    loc_state = (location or {}).get("state", "")
+    coops_station = (location or {}).get("coops_station", WATER_TEMP_STATION)
+
+    # Marine conditions (NWS) and water temperature (NOAA) are the two
+    # slowest sources and independent of each other, so the marine fetch
+    # runs on the shared pool while this thread fetches water temperature.
+    # Both append to sources_used / fallbacks_triggered; that is safe across
+    # threads because list.append is atomic and both lists are only emitted
+    # as sorted(set(...)), so append order does not matter.
+    marine_f = _upstream_pool.submit(
+        builder.marine_service.get_marine_forecast,
         month,
         location,
         sources_used=sources_used,
         fallbacks_triggered=fallbacks_triggered,
     )
+    try:
+        water_temp, temp_is_live = get_water_temp(
+            month,
+            location,
+            sources_used=sources_used,
+            fallbacks_triggered=fallbacks_triggered,
+        )
+    except BaseException:
+        marine_f.cancel()
+        raise
+    wind_range, wave_range, wind_dir = marine_f.result()
 
     def format_range(r: Optional[Tuple[float, float]], unit: str) -> str:
         if r is None:
@@ -1482,8 +1568,6 @@ def generate_forecast(
             return f"{low:.0f} {unit}"
         return f"{low:.0f}-{high:.0f} {unit}"
 
-    loc_lat = (location or {}).get("lat", _LAT)
-    loc_lng = (location or {}).get("lng", _LNG)
     sunrise, sunset, sun_str = builder.astro_service.get_sun_times(now, loc_lat, loc_lng, tz_name)
 
     wind_str = format_range(wind_range, "kt")
@@ -1534,7 +1618,6 @@ def generate_forecast(
     conditions_region = (location or {}).get("conditions_region", "atlantic_mid")
     coast = "west" if conditions_region.startswith("pacific") else ("hawaii" if conditions_region.startswith("hawaii") else "east")
 
-    loc_state = (location or {}).get("state", "")
     loc_fish_region = (location or {}).get("fish_region", "")
     profile = profile or {}
     species = build_species_ranking(
@@ -1605,7 +1688,6 @@ def generate_forecast(
     else:
         fallbacks_triggered.append("current_weather_unavailable")
 
-    coops_station = (location or {}).get("coops_station", WATER_TEMP_STATION)
     env_metrics = builder.environment_service.get_coops_environmental(coops_station)
     if env_metrics:
         if weather:
@@ -1826,7 +1908,7 @@ def personalize_forecast(
         return forecast
 
     tz_name = (location or {}).get("timezone", "America/New_York")
-    tz = _safe_zone(tz_name)
+    tz = safe_zone(tz_name)
     now = datetime.now(tz)
     month = now.month
 
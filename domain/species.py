@@ -2,13 +2,31 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import operator
 import re
-from typing import Any, Dict, List, Optional, Tuple
+import sys
+from array import array
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
 
 from locations import get_monthly_water_temps
 from regulations import lookup_regulation
-from storage.species_loader import SPECIES_DB
+from storage.species_loader import (
+    GOOD_SHIFT,
+    PROTECTED_MASK,
+    RIGS,
+    SEASON_MASKS,
+    SPECIES_BY_NAME,
+    SPECIES_DB,
+    TEMP_IDEAL_HIGH,
+    TEMP_IDEAL_LOW,
+    TEMP_MAX,
+    TEMP_MIN,
+    indices_in_temp_range,
+    load_seasonal_explanations,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -22,10 +40,20 @@ logger = logging.getLogger(__name__)
 # to that style (e.g. many species can be caught from both surf and pier).
 # ---------------------------------------------------------------------------
 
+
+def _name_set(names: Iterable[str]) -> FrozenSet[str]:
+    """Freeze a species-name set, interning each name.
+
+    The loader interns ``sp["name"]``, so membership tests against these
+    sets match on identity before falling back to a string compare.
+    """
+    return frozenset(sys.intern(n) for n in names)
+
+
 # -- Fishing type (where you fish) --
 # Species that are ONLY realistic from a boat offshore — exclude for
 # surf/pier/inshore-only anglers.
-_OFFSHORE_ONLY_SPECIES: set = {
+_OFFSHORE_ONLY_SPECIES: FrozenSet[str] = _name_set({
     "Mahi-mahi (dolphinfish)", "Wahoo", "Blackfin tuna", "Yellowfin tuna",
     "Sailfish", "Blue marlin", "White marlin", "Skipjack tuna",
     "Bigeye tuna", "Albacore tuna", "Frigate mackerel",
@@ -37,10 +65,10 @@ _OFFSHORE_ONLY_SPECIES: set = {
     "Lesser amberjack", "Rainbow runner",
     "Shortfin mako shark", "Thresher shark", "Tiger shark",
     "Ocean sunfish (mola mola)",
-}
+})
 
 # Species best caught from a pier or jetty (structure-dependent).
-_PIER_SPECIES: set = {
+_PIER_SPECIES: FrozenSet[str] = _name_set({
     "Sheepshead", "Tautog (blackfish)", "Black sea bass", "Spadefish (Atlantic)",
     "Triggerfish (gray)", "Lookdown", "Mangrove snapper (gray snapper)",
     "Hogfish", "Planehead filefish", "Northern puffer (blowfish)",
@@ -58,10 +86,10 @@ _PIER_SPECIES: set = {
     "Kelp bass (calico bass)", "Sand bass (barred sand bass)",
     "California sheephead", "Opaleye", "Halfmoon (Catalina perch)",
     "Kelp greenling", "Rock greenling",
-}
+})
 
 # Species primarily caught from the surf zone.
-_SURF_SPECIES: set = {
+_SURF_SPECIES: FrozenSet[str] = _name_set({
     "Red drum (puppy drum)", "Pompano", "Whiting (sea mullet, kingfish)",
     "Southern kingfish (ground mullet)", "Gulf kingfish (gulf whiting)",
     "Northern kingfish",
@@ -70,10 +98,10 @@ _SURF_SPECIES: set = {
     "Corbina", "Spotfin croaker", "Yellowfin croaker",
     "Leopard shark", "Shovelnose guitarfish",
     "Moi (Pacific threadfin)", "Bonefish (oio)",
-}
+})
 
 # Species best caught inshore (inlet, marsh, flats).
-_INSHORE_SPECIES: set = {
+_INSHORE_SPECIES: FrozenSet[str] = _name_set({
     "Speckled trout (spotted seatrout)", "Red drum (puppy drum)",
     "Southern flounder", "Flounder (summer flounder)", "Gulf flounder",
     "Snook", "Tripletail", "Ladyfish", "Jack crevalle",
@@ -87,10 +115,10 @@ _INSHORE_SPECIES: set = {
     "Redear sunfish (shellcracker)", "Bluegill", "Warmouth",
     "American eel",
     "Giant trevally (ulua)", "Bluefin trevally (omilu)", "Papio (juvenile jack)",
-}
+})
 
 # -- Target categories (what you want to catch) --
-_BOTTOM_SPECIES: set = {
+_BOTTOM_SPECIES: FrozenSet[str] = _name_set({
     "Red drum (puppy drum)", "Black drum", "Black drum (large bull)",
     "Whiting (sea mullet, kingfish)", "Spot", "Atlantic croaker",
     "Southern kingfish (ground mullet)", "Gulf kingfish (gulf whiting)",
@@ -104,9 +132,9 @@ _BOTTOM_SPECIES: set = {
     "Walleye surfperch", "Rubberlip seaperch",
     "Hardhead catfish (sea catfish)", "Gafftopsail catfish",
     "Bonefish (oio)", "Moi (Pacific threadfin)",
-}
+})
 
-_PELAGIC_SPECIES: set = {
+_PELAGIC_SPECIES: FrozenSet[str] = _name_set({
     "Bluefish", "Spanish mackerel", "King mackerel (kingfish)",
     "False albacore (little tunny)", "Atlantic bonito",
     "Cobia", "Jack crevalle", "Blue runner (hardtail)",
@@ -118,9 +146,9 @@ _PELAGIC_SPECIES: set = {
     "Ladyfish", "Great barracuda", "Tarpon",
     "Giant trevally (ulua)", "Bluefin trevally (omilu)", "Papio (juvenile jack)",
     "Striped bass (rockfish)",
-}
+})
 
-_STRUCTURE_SPECIES: set = {
+_STRUCTURE_SPECIES: FrozenSet[str] = _name_set({
     "Sheepshead", "Tautog (blackfish)", "Black sea bass",
     "Triggerfish (gray)", "Spadefish (Atlantic)",
     "Red snapper", "Vermilion snapper (beeliner)",
@@ -135,9 +163,9 @@ _STRUCTURE_SPECIES: set = {
     "Kelp bass (calico bass)", "Sand bass (barred sand bass)",
     "California sheephead", "Opaleye",
     "Mu (bigeye emperor)", "Menpachi (soldierfish)",
-}
+})
 
-_GAMEFISH_SPECIES: set = {
+_GAMEFISH_SPECIES: FrozenSet[str] = _name_set({
     "Blacktip shark", "Spinner shark", "Bull shark", "Sandbar shark",
     "Lemon shark", "Dusky shark", "Bonnethead shark",
     "Atlantic sharpnose shark", "Scalloped hammerhead shark",
@@ -149,11 +177,11 @@ _GAMEFISH_SPECIES: set = {
     "Greater amberjack", "Jack crevalle",
     "Giant trevally (ulua)", "Kaku (barracuda)",
     "Snook", "Permit",
-}
+})
 
 # Species that are nuisance bycatch and not worth targeting from the surf or pier.
 # These are excluded from the "What's Biting Now" ranking entirely.
-_NUISANCE_SPECIES: set = {
+_NUISANCE_SPECIES: FrozenSet[str] = _name_set({
     "Lizardfish",               # Pure nuisance — no food/sport value
     "Hardhead catfish (sea catfish)",  # Venomous spines, slimy, universally disliked
     "Gafftopsail catfish",      # Same deal as hardhead — bycatch pest
@@ -162,7 +190,7 @@ _NUISANCE_SPECIES: set = {
     "Pigfish",                  # Marginal grunt bycatch
     "Ribbonfish (Atlantic cutlassfish)",  # Occasional pier bycatch, not a target
     "Hogchoker",                # Tiny flatfish, no sport or food value
-}
+})
 
 
 def _species_matches_profile(
@@ -227,226 +255,46 @@ def _species_matches_profile(
 # back to explanation_cold (winter) or explanation_warm (summer).
 # ---------------------------------------------------------------------------
 
+# Meteorological season by month number (index 0 unused).
+_SEASON_BY_MONTH: Tuple[str, ...] = (
+    "",
+    "winter", "winter", "spring", "spring", "spring", "summer",
+    "summer", "summer", "fall", "fall", "fall", "winter",
+)
+
+
 def _get_season(month: int) -> str:
-    """Map month number to meteorological season name."""
-    if month in (12, 1, 2):
-        return "winter"
-    if month in (3, 4, 5):
-        return "spring"
-    if month in (6, 7, 8):
-        return "summer"
-    return "fall"
-
-
-SEASONAL_EXPLANATIONS: Dict[str, Dict[str, str]] = {
-    "Red drum (puppy drum)": {
-        "spring": "Red drum are pushing into the surf zone and inlets as water warms; they feed aggressively on shrimp, crabs and mullet during the spring transition.",
-        "fall": "The fall red drum run is on — large schools move through inlets and along the beach, feeding heavily on mullet and menhaden before winter.",
-    },
-    "Speckled trout (spotted seatrout)": {
-        "spring": "Speckled trout are moving onto grass flats and into creeks as water warms; the spring bite picks up fast on live shrimp under popping corks.",
-        "fall": "Speckled trout are feeding heavily in creeks and along grass lines before cold weather; this is prime time for big gator trout.",
-    },
-    "Black drum": {
-        "spring": "Black drum are spawning in inlets and around structure; large fish congregate and feed on crabs, clams and shrimp during the spring run.",
-        "fall": "Black drum are stacking up around inlets and pilings, feeding aggressively before winter; cut crab and shrimp on bottom rigs are productive.",
-    },
-    "Sheepshead": {
-        "spring": "Sheepshead are spawning around nearshore structure and pilings; this is peak season — fish straight down with fiddler crabs or sand fleas.",
-        "fall": "Sheepshead are returning to pier pilings and jetties as water cools; they pick at barnacles and crabs around structure.",
-    },
-    "Flounder (summer flounder)": {
-        "spring": "Summer flounder are migrating inshore through inlets; ambush them with live finger mullet drifted slowly along the bottom near structure.",
-        "fall": "Flounder are staging at inlets for their fall migration offshore; this is prime time as they feed heavily before moving to deeper water.",
-    },
-    "Southern flounder": {
-        "spring": "Southern flounder are moving into creeks and inshore waters as spring warms up; live finger mullet near creek mouths is the top producer.",
-        "fall": "The fall flounder run is the best fishing of the year — southern flounder push through inlets and creeks heading offshore to spawn.",
-    },
-    "Bluefish": {
-        "spring": "Bluefish are arriving from the south in big schools, feeding voraciously on everything; cut menhaden and metal jigs produce explosive strikes.",
-        "fall": "Large bluefish (choppers) are running south through the surf and around piers; the fall run produces the biggest fish of the year.",
-    },
-    "Spanish mackerel": {
-        "spring": "Spanish mackerel are just arriving as water hits the upper 60s; early fish are hungry and hit shiny spoons and live bait aggressively.",
-        "fall": "Spanish mackerel are still around but thinning out as water cools; catch them before they migrate south for winter.",
-    },
-    "Pompano": {
-        "spring": "Pompano are running the surf line in spring, feeding on sand fleas and small crustaceans; target the troughs with double-dropper rigs.",
-        "fall": "The fall pompano run brings fish back through the surf zone; sand fleas and Fishbites in the wash zone are the ticket.",
-    },
-    "Spot": {
-        "spring": "Spot are starting to move inshore and school along the beach; bloodworms and shrimp on small hooks produce steady catches.",
-        "fall": "The fall spot run is a major NC fishing event — massive schools move through the surf and around piers, biting everything.",
-    },
-    "Atlantic croaker": {
-        "spring": "Croaker are beginning to move inshore as water warms; fresh shrimp and bloodworms on bottom rigs catch early fish.",
-        "fall": "Fall croaker runs bring big numbers to the surf and piers; they school up and bite aggressively on shrimp and worms.",
-    },
-    "Striped bass (rockfish)": {
-        "spring": "Striped bass are feeding heavily before moving north for summer; target them at dawn and dusk with cut menhaden and live mullet.",
-        "fall": "Striped bass are returning from the north and feeding in the surf and around inlets; the fall run offers the best inshore action.",
-    },
-    "Cobia": {
-        "spring": "Cobia are arriving with the warming water; early fish show up around buoys, piers and channel markers — sight-cast live eels or menhaden.",
-        "fall": "Late-season cobia are still cruising near structure before migrating south; fish near buoys and pier ends with live bait.",
-    },
-    "King mackerel (kingfish)": {
-        "spring": "King mackerel are arriving from the south; early kings cruise near piers and along the beach chasing baitfish schools.",
-        "fall": "The fall king mackerel run brings big fish close to shore and piers; slow-troll live baits on wire leader for smoker kings.",
-    },
-    "False albacore (little tunny)": {
-        "spring": "False albacore are passing through during spring migration; look for surface blitzes and cast jigs or live baits into breaking fish.",
-        "fall": "The fall false albacore blitz is legendary — massive schools chase bait to the surface near piers and along the beach.",
-    },
-    "Whiting (sea mullet, kingfish)": {
-        "spring": "Whiting are moving into the surf as water warms; fresh shrimp and sand fleas on double-dropper rigs in the wash zone are deadly.",
-        "fall": "Whiting are schooling up in the surf before moving to deeper water; bloodworms and shrimp produce fast action on light tackle.",
-    },
-    "Gray trout (weakfish)": {
-        "spring": "Gray trout are moving inshore through inlets and along the beach; live shrimp on light tackle near structure is the best approach.",
-        "fall": "Gray trout are feeding in inlets and along the beach before winter; target the fall run with live shrimp drifted near the bottom.",
-    },
-    "Tautog (blackfish)": {
-        "spring": "Tautog are actively feeding around jetties and pilings as water warms in early spring; this is a brief but productive window.",
-        "fall": "Tautog are moving back to nearshore structure as water cools; the fall bite around rock piles and jetties is excellent.",
-    },
-    "Hickory shad": {
-        "spring": "The spring hickory shad run is one of NC's best seasonal events — fish stack up in rivers and at bridges, hammering small shad darts.",
-        "fall": "Hickory shad are offshore and not available inshore during fall months.",
-    },
-    "American shad": {
-        "spring": "American shad are making their massive spring spawning run up NC rivers; the Cape Fear and Neuse are packed with fish hitting small bright jigs.",
-        "fall": "American shad are in the ocean and not available for inshore fishing during fall.",
-    },
-    "Striped mullet": {
-        "spring": "Mullet are scattered in inlets and creeks; cast-net them for bait or target them on tiny hooks with bread dough.",
-        "fall": "The fall mullet run is THE bait event of the year — huge schools push through inlets and along the beach. Stock your freezer.",
-    },
-    "Cownose ray": {
-        "spring": "Cownose rays are beginning to arrive in large migrating schools; they move through the surf and inlets heading north.",
-        "fall": "Massive schools of cownose rays migrate south through NC waters in fall; they are commonly hooked while bottom fishing.",
-    },
-    "Atlantic bonito": {
-        "spring": "Atlantic bonito are passing through during spring migration; they school nearshore and hit small metal jigs and live baits.",
-        "fall": "Fall is prime bonito season — they blitz bait nearshore and around piers, hitting jigs and small live baits at high speed.",
-    },
-    "Jack crevalle": {
-        "spring": "Jack crevalle are arriving with warm water; early fish push bait in inlets and along the surf line.",
-        "fall": "Jack crevalle are still feeding aggressively before migrating south; they crash baitfish schools in inlets and around piers.",
-    },
-    "Greater amberjack": {
-        "spring": "Amberjack are moving onto nearshore wrecks and reefs as water warms; they hit live baits and heavy jigs with brute force.",
-        "fall": "Amberjack are feeding aggressively on nearshore structure before winter; the fall bite on wrecks and reefs is excellent.",
-    },
-    "Gag grouper": {
-        "spring": "Gag grouper are moving shallower onto nearshore wrecks and reefs; live bait on heavy tackle near structure is the play.",
-        "fall": "Gag grouper are feeding heavily on nearshore reefs before moving to deeper spawning grounds; fall is prime nearshore grouper season.",
-    },
-    "Red snapper": {
-        "spring": "Red snapper are becoming more active on nearshore wrecks as water warms; cut squid and live bait on bottom rigs produce bites.",
-        "fall": "Red snapper are aggressive on nearshore structure during fall; they hit cut and live baits readily before winter slowdown.",
-    },
-    "Tripletail": {
-        "spring": "Tripletail are just arriving near buoys and crab pot floats; sight-cast live shrimp to fish laying on their sides near the surface.",
-        "fall": "Late-season tripletail are still found near floating structure before migrating south; they become less common as water cools.",
-    },
-    "Ribbonfish (Atlantic cutlassfish)": {
-        "spring": "Ribbonfish are starting to show up around piers and lighted docks as water warms.",
-        "fall": "Fall is peak ribbonfish season — they swarm pier lights at night, hitting small shiny jigs and cut bait strips.",
-    },
-    "Mahi-mahi (dolphinfish)": {
-        "spring": "Early mahi are showing up along weedlines and temperature breaks as the Gulf Stream pushes warm water closer to shore.",
-        "fall": "Late-season mahi are still available along the Gulf Stream edge; smaller schoolies are common around floating debris.",
-    },
-    "Black sea bass": {
-        "spring": "Black sea bass are active on nearshore wrecks and hard bottom during spring; squid strips and cut bait on bottom rigs are productive.",
-        "fall": "Black sea bass are feeding on nearshore reefs before moving inshore for winter; the fall bite over structure is strong.",
-    },
-    "Blacktip shark": {
-        "spring": "Blacktip sharks are arriving with warming water; they begin patrolling the surf zone following schools of mullet and menhaden.",
-        "fall": "Blacktip sharks are still feeding in the surf before migrating south; they follow the fall mullet run down the coast.",
-    },
-    "Smooth dogfish": {
-        "spring": "Smooth dogfish are one of the first sharks to arrive inshore in spring; they school along the bottom feeding on crabs, shrimp and small fish.",
-        "fall": "Smooth dogfish are feeding heavily before their fall migration; they are abundant from piers and in the surf on any cut bait.",
-    },
-    "Thresher shark": {
-        "spring": "Thresher sharks pass through NC waters during their spring northward migration, following schools of menhaden and herring.",
-        "fall": "Thresher sharks are migrating south through NC waters in fall; they are most commonly encountered during the seasonal transition.",
-    },
-    "Clearnose skate": {
-        "spring": "Clearnose skates are still abundant inshore during early spring; they are common bottom catches from piers before moving deeper as water warms.",
-        "fall": "Clearnose skates are moving back inshore as water cools; they become increasingly common from piers during the fall transition.",
-    },
-    "Silver perch": {
-        "spring": "Silver perch are moving inshore as water warms; they school along the beach and around piers, biting small shrimp and worm baits.",
-        "fall": "Silver perch are schooling up before heading to deeper water; the fall bite from piers and the surf is productive.",
-    },
-    "Sand seatrout (white trout)": {
-        "spring": "Sand seatrout are moving inshore and schooling around structure as water warms; live shrimp and cut bait produce steady action.",
-        "fall": "Sand seatrout are feeding actively before winter; they school in good numbers around piers and in the surf.",
-    },
-    "Atlantic menhaden (bunker)": {
-        "spring": "Menhaden schools are pushing inshore and through inlets; stock up on bait with cast nets and sabiki rigs for the season ahead.",
-        "fall": "The fall menhaden run brings massive schools along the beach and through inlets; this is the premier bait event — fill your freezer.",
-    },
-    "Butterfish": {
-        "spring": "Butterfish are moving inshore as water cools in late spring; occasional catches from piers during the transition.",
-        "fall": "Butterfish are arriving inshore in fall as water cools; they school around pier lights and structure in good numbers.",
-    },
-    "American eel": {
-        "spring": "American eels are becoming more active as water warms; night fishing around piers and docks produces catches.",
-        "fall": "Fall is peak eel season as they migrate toward the ocean to spawn; catch them at night around piers for excellent striper bait.",
-    },
-    "Gulf flounder": {
-        "spring": "Gulf flounder are migrating inshore through inlets alongside summer flounder; live finger mullet near structure is the best approach.",
-        "fall": "Gulf flounder are staging at inlets for their fall offshore migration; target them with live mullet in the troughs and near pilings.",
-    },
-    "Southern kingfish (ground mullet)": {
-        "spring": "Southern kingfish are moving into the surf as water warms; they arrive slightly earlier than northern kingfish and hit sand fleas and shrimp.",
-        "fall": "Southern kingfish are schooling in the surf before heading to deeper water; fall action is fast on shrimp and sand fleas.",
-    },
-    "Striped burrfish (spiny boxfish)": {
-        "spring": "Striped burrfish are common inshore during spring; these spiny puffers inflate when caught and are frequently hooked on bottom baits.",
-        "fall": "Striped burrfish are abundant inshore during fall on structure and grass beds; they are common incidental catches.",
-    },
-    "Atlantic herring": {
-        "spring": "Atlantic herring are thinning out as water warms; catch remaining schools on sabiki rigs for striper bait before they leave.",
-        "fall": "Atlantic herring are arriving inshore as water cools; sabiki rig them from piers for excellent striper and bluefish bait.",
-    },
-    "Blueback herring": {
-        "spring": "Blueback herring are running up NC rivers for spawning alongside shad; they hit small, bright darts and are excellent bait.",
-        "fall": "Blueback herring are offshore and not available inshore during fall.",
-    },
-    "Alewife": {
-        "spring": "Alewife are making their spring spawning run up NC rivers; they hit small darts and jigs at bridges and dams.",
-        "fall": "Alewife are offshore and not available inshore during fall.",
-    },
-    "White perch": {
-        "spring": "White perch are moving into tidal creeks and brackish water as temperatures rise; bloodworms and small shrimp produce steady catches.",
-        "fall": "White perch are feeding actively in brackish creeks before winter; they school in good numbers and bite small baits readily.",
-    },
-    "Spotted hake": {
-        "spring": "Spotted hake are still present inshore during early spring; they will move deeper as water warms past the upper 50s.",
-        "fall": "Spotted hake are moving inshore as water cools; they become increasingly common bottom catches from piers during late fall.",
-    },
+    """Map month number (1-12) to meteorological season name."""
+    return _SEASON_BY_MONTH[month]
+
+
+# Season-specific overrides (spring/fall for species with distinct
+# transitional behaviour), kept as data in storage/seasonal_explanations.json.
+# Read-only views: these are shared by every request and never edited.
+SEASONAL_EXPLANATIONS: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    name: MappingProxyType({sys.intern(season): text for season, text in overrides.items()})
+    for name, overrides in load_seasonal_explanations(species_names=SPECIES_BY_NAME).items()
+})
+
+# The same overrides flattened to (name, season) keys: one probe per
+# lookup, and a miss doesn't go through an intermediate per-species dict.
+_SEASONAL_OVERRIDES: Dict[Tuple[str, str], str] = {
+    (name, season): text
+    for name, overrides in SEASONAL_EXPLANATIONS.items()
+    for season, text in overrides.items()
 }
 
 
-def _get_explanation(sp: Dict[str, Any], month: int, water_temp: float) -> str:
+def _get_explanation(sp: Dict[str, Any], season: str, water_temp: float) -> str:
     """Pick the best seasonal explanation for a species.
 
     Checks for a season-specific override first (spring/fall for species with
     distinct transitional behaviour).  Falls back to the cold/warm explanation
     based on current water temperature.
     """
-    season = _get_season(month)
-    name = sp["name"]
-
-    overrides = SEASONAL_EXPLANATIONS.get(name)
-    if overrides and season in overrides:
-        return overrides[season]
+    override = _SEASONAL_OVERRIDES.get((sp["name"], season))
+    if override is not None:
+        return override
 
     # Default: cold/warm split based on water temperature
     is_cold = water_temp < 65
@@ -560,7 +408,8 @@ def _get_technique_tip(
 # Dynamic rig recommendations -- built from active species
 # ---------------------------------------------------------------------------
 
-RIG_CATEGORIES: Dict[str, Dict[str, Any]] = {
+# Read-only: recommendations copy fields out of it rather than sharing it.
+RIG_CATEGORIES: Mapping[str, Dict[str, Any]] = MappingProxyType({
     "fishfinder": {
         "name": "Fish Finder Rig (Carolina Rig)",
         "description": (
@@ -716,7 +565,7 @@ RIG_CATEGORIES: Dict[str, Dict[str, Any]] = {
         "leader": "8-12 lb mono, 18 in between jigs",
         "image": "images/rigs/tandem-jig.svg",
     },
-}
+})
 
 
 def _classify_rig(rig_text: str) -> str:
@@ -755,6 +604,72 @@ def _classify_rig(rig_text: str) -> str:
     return "fishfinder"
 
 
+# Every rig description in the catalog, classified once at import so
+# building recommendations is a dict hit per species rather than a run of
+# substring scans.
+_RIG_KEY_BY_TEXT: Dict[str, str] = {rig: _classify_rig(rig) for rig in RIGS}
+
+
+_RIG_FIELDS = operator.itemgetter("name", "rig", "hook_size", "sinker")
+
+# The display fields of each rig category as one tuple, so a recommendation
+# takes a single lookup and unpack instead of a read per field.
+_RIG_TUPLES: Dict[str, Tuple[str, str, str, str, str]] = {
+    key: (cat["name"], cat["description"], cat["mainline"], cat["leader"], cat.get("image", ""))
+    for key, cat in RIG_CATEGORIES.items()
+}
+
+
+def _first_n_distinct(items: Iterable[str], n: int) -> List[str]:
+    """Return the first *n* distinct values of *items*, in order, stopping early."""
+    seen: set = set()
+    out: List[str] = []
+    for item in items:
+        if item not in seen:
+            seen.add(item)
+            out.append(item)
+            if len(out) == n:
+                break
+    return out
+
+
+@functools.lru_cache(maxsize=128)
+def _rig_groups(
+    ranked: Tuple[Tuple[str, str, str, str], ...],
+) -> Tuple[Tuple[str, Tuple[str, ...], str, str], ...]:
+    """Group ``(name, rig, hook, sinker)`` rows into ``(rig key, targets,
+    hook text, sinker text)``, ordered by each rig's best-ranked species.
+
+    Keyed on the display fields alone, so a repeat of the same ranking
+    skips the classification and de-duplication work entirely.
+    """
+    # Dicts keep insertion order, so groups come out ordered by the
+    # highest-ranked species using each rig.
+    rig_groups: Dict[str, List[Tuple[str, str, str, str]]] = {}
+
+    for row in ranked:
+        rig = row[1]
+        key = _RIG_KEY_BY_TEXT.get(rig)
+        if key is None:
+            key = _classify_rig(rig)
+        group = rig_groups.get(key)
+        if group is None:
+            group = rig_groups[key] = []
+        group.append(row)
+
+    groups = []
+    for key, group in rig_groups.items():
+        if key not in _RIG_TUPLES:
+            continue
+        groups.append((
+            key,
+            tuple(row[0] for row in group),
+            " or ".join(_first_n_distinct((row[2] for row in group), 3)),
+            " or ".join(_first_n_distinct((row[3] for row in group), 3)),
+        ))
+    return tuple(groups)
+
+
 def build_rig_recommendations(
     species_ranking: List[Dict[str, Any]],
 ) -> List[Dict[str, Any]]:
@@ -763,36 +678,20 @@ def build_rig_recommendations(
     Groups active species by rig type and produces one recommendation
     per rig, ordered by the highest-ranked species that uses it.
     """
-    rig_groups: Dict[str, List[Dict[str, Any]]] = {}
-    rig_order: List[str] = []
-
-    for sp in species_ranking:
-        key = _classify_rig(sp["rig"])
-        if key not in rig_groups:
-            rig_groups[key] = []
-            rig_order.append(key)
-        rig_groups[key].append(sp)
+    groups = _rig_groups(tuple(_RIG_FIELDS(sp) for sp in species_ranking))
 
     recommendations: List[Dict[str, Any]] = []
-    for key in rig_order:
-        group = rig_groups[key]
-        category = RIG_CATEGORIES.get(key)
-        if category is None:
-            continue
-
-        species_names = [sp["name"] for sp in group]
-        hooks = list(dict.fromkeys(sp["hook_size"] for sp in group))
-        sinkers = list(dict.fromkeys(sp["sinker"] for sp in group))
-
+    for key, targets, hook, sinker in groups:
+        name, description, mainline, leader, image = _RIG_TUPLES[key]
         recommendations.append({
-            "name": category["name"],
-            "description": category["description"],
-            "mainline": category["mainline"],
-            "leader": category["leader"],
-            "hook": " or ".join(hooks[:3]),
-            "sinker": " or ".join(sinkers[:3]),
-            "targets": species_names,
-            "image": category.get("image", ""),
+            "name": name,
+            "description": description,
+            "mainline": mainline,
+            "leader": leader,
+            "hook": hook,
+            "sinker": sinker,
+            "targets": list(targets),
+            "image": image,
             "knots": get_knots_for_rig(key),
         })
 
@@ -1117,33 +1016,103 @@ def _score_species(
       wave height, and time-of-day adjustments.
     - Presence penalty (-100): water temp outside survivable range.
     """
-    score = 0.0
-
     if water_temp < sp["temp_min"] or water_temp > sp["temp_max"]:
         return -100.0
 
-    ideal_low = sp["temp_ideal_low"]
-    ideal_high = sp["temp_ideal_high"]
+    score = _base_score(
+        water_temp, 1 << (month - 1),
+        sp["temp_min"], sp["temp_max"], sp["temp_ideal_low"], sp["temp_ideal_high"],
+        sp["season_mask"],
+    )
+
+    # --- Dynamic conditions modifiers ---
+    score += _conditions_modifier(sp, wind_dir, wind_range, wave_range, hour, coast)
+
+    return score
+
+
+def _base_score(
+    water_temp: float,
+    month_bit: int,
+    temp_min: float,
+    temp_max: float,
+    ideal_low: float,
+    ideal_high: float,
+    season_mask: int,
+) -> float:
+    """Temperature fit (0-50) plus seasonal fit (0-30) for an in-range species.
+
+    Takes plain numbers rather than a species mapping so it can be fed
+    straight from the packed catalog columns.
+    """
     if ideal_low <= water_temp <= ideal_high:
-        score += 50.0
+        score = 50.0
     elif water_temp < ideal_low:
         distance = ideal_low - water_temp
-        temp_range = ideal_low - sp["temp_min"]
-        score += max(0, 50.0 * (1 - distance / temp_range)) if temp_range > 0 else 25.0
+        temp_range = ideal_low - temp_min
+        score = max(0, 50.0 * (1 - distance / temp_range)) if temp_range > 0 else 25.0
     else:
         distance = water_temp - ideal_high
-        temp_range = sp["temp_max"] - ideal_high
-        score += max(0, 50.0 * (1 - distance / temp_range)) if temp_range > 0 else 25.0
+        temp_range = temp_max - ideal_high
+        score = max(0, 50.0 * (1 - distance / temp_range)) if temp_range > 0 else 25.0
+
+    # Seasonal fit as a weighted sum of membership flags: peak outranks good,
+    # so a month listed in both still only earns the peak bonus.
+    in_peak = bool(season_mask & month_bit)
+    in_good = bool(season_mask & month_bit << GOOD_SHIFT) and not in_peak
+    return score + 30.0 * in_peak + 15.0 * in_good
+
+
+@functools.lru_cache(maxsize=256)
+def _base_scores(
+    month: int, water_temp: float, coast: str,
+) -> Tuple[Tuple[int, float], ...]:
+    """Return ``(SPECIES_DB index, base score)`` for every in-range *coast* species.
+
+    One pass over the packed temperature, coast and season-mask columns; the
+    per-species conditions modifier is layered on by the caller.  Water
+    temperature moves slowly and the catalog is frozen, so results are
+    memoized: every user at the same location, and outlook days sharing
+    a monthly average temperature, reuse one computation.
+
+    This stays plain Python on purpose.  A cache miss scores a few hundred
+    rows and a hit does no scoring at all, so a numba/Cython kernel would
+    add a compiled build dependency to save microseconds per new
+    (month, temperature) pair.
+    """
+    month_bit = 1 << (month - 1)
+    return tuple(
+        (i, _base_score(
+            water_temp, month_bit,
+            TEMP_MIN[i], TEMP_MAX[i], TEMP_IDEAL_LOW[i], TEMP_IDEAL_HIGH[i],
+            SEASON_MASKS[i],
+        ))
+        for i in indices_in_temp_range(water_temp, coast)
+    )
 
-    if month in sp["peak_months"]:
-        score += 30.0
-    elif month in sp["good_months"]:
-        score += 15.0
 
-    # --- Dynamic conditions modifiers ---
-    score += _conditions_modifier(sp, wind_dir, wind_range, wave_range, hour, coast)
+# Catalog-wide, request-independent ranking exclusions, precomputed per
+# species: protected/endangered species are release-only and nuisance or
+# bycatch species aren't worth targeting.
+_TARGETABLE: array = array("b", (
+    not protected and sp["name"] not in _NUISANCE_SPECIES
+    for sp, protected in zip(SPECIES_DB, PROTECTED_MASK)
+))
 
-    return score
+
+@functools.lru_cache(maxsize=256)
+def _ranking_candidates(
+    month: int, water_temp: float, coast: str,
+) -> Tuple[Tuple[int, float], ...]:
+    """``_base_scores`` narrowed to targetable species.
+
+    Memoized alongside it, so the fixed exclusions are applied once per
+    (month, temperature, coast) rather than re-tested for every species on
+    every ranking.
+    """
+    return tuple(
+        (i, base) for i, base in _base_scores(month, water_temp, coast) if _TARGETABLE[i]
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -1155,7 +1124,7 @@ def _score_species(
 
 # Species that bite better on an incoming (onshore) wind -- the wind pushes
 # bait and turbid water toward shore, stimulating feeding.
-_ONSHORE_WIND_SPECIES: set = {
+_ONSHORE_WIND_SPECIES: FrozenSet[str] = _name_set({
     "Red drum (puppy drum)", "Bluefish", "Pompano", "Whiting (sea mullet, kingfish)",
     "Spot", "Atlantic croaker", "Flounder (summer flounder)", "Southern flounder",
     "Gulf flounder", "Spanish mackerel", "Jack crevalle", "Cobia",
@@ -1168,10 +1137,10 @@ _ONSHORE_WIND_SPECIES: set = {
     "Leopard shark", "Shovelnose guitarfish",
     # Hawaii
     "Giant trevally (ulua)", "Moi (Pacific threadfin)", "Bonefish (oio)",
-}
+})
 
 # Species that prefer calmer conditions and/or offshore wind (clearer water).
-_CALM_WATER_SPECIES: set = {
+_CALM_WATER_SPECIES: FrozenSet[str] = _name_set({
     "Sheepshead", "Tautog (blackfish)", "Triggerfish (gray)", "Spadefish (Atlantic)",
     "Mangrove snapper (gray snapper)", "Hogfish", "Bermuda chub (sea chub)",
     "Lookdown", "Sergeant major (damselfish)", "Planehead filefish",
@@ -1183,10 +1152,10 @@ _CALM_WATER_SPECIES: set = {
     "Opaleye", "Halfmoon (Catalina perch)", "California halibut", "White seabass",
     # Hawaii
     "Mu (bigeye emperor)", "Menpachi (soldierfish)", "Aholehole (Hawaiian flagtail)",
-}
+})
 
 # Species that feed more actively in rougher surf.
-_ROUGH_SURF_SPECIES: set = {
+_ROUGH_SURF_SPECIES: FrozenSet[str] = _name_set({
     "Red drum (puppy drum)", "Bluefish", "Striped bass (rockfish)",
     "Whiting (sea mullet, kingfish)", "Pompano", "Black drum",
     "Smooth dogfish", "Atlantic croaker", "Spot",
@@ -1194,10 +1163,10 @@ _ROUGH_SURF_SPECIES: set = {
     # Pacific
     "Barred surfperch", "Redtail surfperch", "Calico surfperch",
     "Corbina", "Spotfin croaker", "Yellowfin croaker",
-}
+})
 
 # Species that feed best in low-light conditions (dawn, dusk, night).
-_LOW_LIGHT_SPECIES: set = {
+_LOW_LIGHT_SPECIES: FrozenSet[str] = _name_set({
     "Striped bass (rockfish)", "Speckled trout (spotted seatrout)",
     "Red drum (puppy drum)", "Cobia", "Tarpon", "Flounder (summer flounder)",
     "Southern flounder", "Gulf flounder", "Ribbonfish (Atlantic cutlassfish)",
@@ -1208,10 +1177,10 @@ _LOW_LIGHT_SPECIES: set = {
     "Lingcod", "Cabezon", "Leopard shark", "Bat ray",
     # Hawaii
     "Giant trevally (ulua)", "Menpachi (soldierfish)", "Mu (bigeye emperor)",
-}
+})
 
 # Species that are more active during bright midday conditions.
-_DAYTIME_SPECIES: set = {
+_DAYTIME_SPECIES: FrozenSet[str] = _name_set({
     "Spanish mackerel", "King mackerel (kingfish)", "Cero mackerel",
     "False albacore (little tunny)", "Mahi-mahi (dolphinfish)",
     "Sergeant major (damselfish)", "Blue tang (surgeonfish)",
@@ -1223,7 +1192,30 @@ _DAYTIME_SPECIES: set = {
     "Jacksmelt", "Pacific sardine", "Northern anchovy",
     # Hawaii
     "Bluefin trevally (omilu)", "Papio (juvenile jack)", "Kaku (barracuda)",
-}
+})
+
+# Condition-preference groups above as bit flags, so a species' group
+# memberships are looked up once as a single int instead of probing each
+# set by name.
+_PREFERS_ONSHORE_WIND = 1
+_PREFERS_CALM_WATER = 2
+_PREFERS_ROUGH_SURF = 4
+_PREFERS_LOW_LIGHT = 8
+_PREFERS_DAYTIME = 16
+
+
+def _condition_flags(name: str) -> int:
+    """Bitmask of the condition-preference groups *name* belongs to."""
+    return (
+        (_PREFERS_ONSHORE_WIND if name in _ONSHORE_WIND_SPECIES else 0)
+        | (_PREFERS_CALM_WATER if name in _CALM_WATER_SPECIES else 0)
+        | (_PREFERS_ROUGH_SURF if name in _ROUGH_SURF_SPECIES else 0)
+        | (_PREFERS_LOW_LIGHT if name in _LOW_LIGHT_SPECIES else 0)
+        | (_PREFERS_DAYTIME if name in _DAYTIME_SPECIES else 0)
+    )
+
+
+_CONDITION_FLAGS: Dict[str, int] = {name: _condition_flags(name) for name in SPECIES_BY_NAME}
 
 # Compass directions grouped for onshore/offshore determination.
 # East-facing coasts (Atlantic): onshore = easterly, offshore = westerly
@@ -1238,48 +1230,68 @@ _OFFSHORE_DIRS_WEST: set = {"E", "NE", "SE", "ENE", "ESE", "NNE", "SSE"}
 _ONSHORE_DIRS = _ONSHORE_DIRS_EAST
 _OFFSHORE_DIRS = _OFFSHORE_DIRS_EAST
 
+# Compass point -> 1 onshore / -1 offshore (absent: neutral), per coast,
+# so classifying a wind direction is one dict probe.
+_WIND_CLASS_EAST: Dict[str, int] = {
+    **{d: 1 for d in _ONSHORE_DIRS_EAST}, **{d: -1 for d in _OFFSHORE_DIRS_EAST},
+}
+_WIND_CLASS_WEST: Dict[str, int] = {
+    **{d: 1 for d in _ONSHORE_DIRS_WEST}, **{d: -1 for d in _OFFSHORE_DIRS_WEST},
+}
 
-def _conditions_modifier(
-    sp: Dict[str, Any],
+
+def _conditions_context(
     wind_dir: Optional[str],
     wind_range: Optional[Tuple[float, float]],
     wave_range: Optional[Tuple[float, float]],
     hour: int,
     coast: str = "east",
-) -> float:
-    """Compute a conditions-based score modifier for a species.
+) -> Tuple[bool, bool, Optional[float], Optional[float], bool, bool]:
+    """Work out the species-independent inputs to the conditions modifier.
 
-    Returns a value between roughly -5 and +15 based on how well current
-    wind direction, wind speed, wave height, and time of day match the
-    species' preferred conditions.
-
-    ``coast`` should be ``"east"`` for Atlantic/Gulf or ``"west"`` for Pacific.
+    Returns ``(is_onshore, is_offshore, wind_avg, wave_avg, is_low_light,
+    is_midday)``; averages are None when the range is unknown.  Callers
+    scoring many species under the same conditions compute this once.
     """
+    wind_class = 0
+    if wind_dir:
+        wind_classes = _WIND_CLASS_WEST if coast == "west" else _WIND_CLASS_EAST
+        wind_class = wind_classes.get(wind_dir, 0)
+    is_onshore = wind_class == 1
+    is_offshore = wind_class == -1
+
+    wind_avg = (wind_range[0] + wind_range[1]) / 2.0 if wind_range else None
+    wave_avg = (wave_range[0] + wave_range[1]) / 2.0 if wave_range else None
+
+    is_low_light = hour < 7 or hour > 18  # before 7am or after 6pm
+    is_midday = 10 <= hour <= 15
+
+    return is_onshore, is_offshore, wind_avg, wave_avg, is_low_light, is_midday
+
+
+def _flags_modifier(
+    flags: int,
+    ctx: Tuple[bool, bool, Optional[float], Optional[float], bool, bool],
+) -> float:
+    """Conditions modifier for a species with condition *flags* under *ctx*."""
+    is_onshore, is_offshore, wind_avg, wave_avg, is_low_light, is_midday = ctx
     modifier = 0.0
-    name = sp["name"]
 
     # --- Wind direction modifier (up to +5 / -3) ---
-    if wind_dir:
-        onshore_dirs = _ONSHORE_DIRS_WEST if coast == "west" else _ONSHORE_DIRS_EAST
-        offshore_dirs = _OFFSHORE_DIRS_WEST if coast == "west" else _OFFSHORE_DIRS_EAST
-        is_onshore = wind_dir in onshore_dirs
-        is_offshore = wind_dir in offshore_dirs
-
-        if name in _ONSHORE_WIND_SPECIES:
-            modifier += 5.0 if is_onshore else (-3.0 if is_offshore else 0.0)
-        elif name in _CALM_WATER_SPECIES:
-            modifier += 5.0 if is_offshore else (-3.0 if is_onshore else 0.0)
+    if flags & _PREFERS_ONSHORE_WIND:
+        modifier += 5.0 if is_onshore else (-3.0 if is_offshore else 0.0)
+    elif flags & _PREFERS_CALM_WATER:
+        modifier += 5.0 if is_offshore else (-3.0 if is_onshore else 0.0)
 
     # --- Wind speed modifier (up to +3 / -2) ---
-    if wind_range:
-        wind_avg = (wind_range[0] + wind_range[1]) / 2.0
-        if name in _ROUGH_SURF_SPECIES:
+    if wind_avg is not None:
+        if flags & _PREFERS_ROUGH_SURF:
             # Moderate wind (10-18 kt) stirs up bait -- bonus
             if 10 <= wind_avg <= 18:
                 modifier += 3.0
             elif wind_avg < 5:
                 modifier -= 2.0
-        elif name in _CALM_WATER_SPECIES:
+        elif flags & _PREFERS_CALM_WATER:
             # Calm conditions (< 8 kt) are ideal
             if wind_avg < 8:
                 modifier += 3.0
@@ -1287,36 +1299,78 @@ def _conditions_modifier(
                 modifier -= 2.0
 
     # --- Wave height modifier (up to +4 / -2) ---
-    if wave_range:
-        wave_avg = (wave_range[0] + wave_range[1]) / 2.0
-        if name in _ROUGH_SURF_SPECIES:
+    if wave_avg is not None:
+        if flags & _PREFERS_ROUGH_SURF:
             # Moderate surf (2-5 ft) concentrates bait in troughs
             if 2 <= wave_avg <= 5:
                 modifier += 4.0
             elif wave_avg < 1:
                 modifier -= 1.0
-        elif name in _CALM_WATER_SPECIES:
+        elif flags & _PREFERS_CALM_WATER:
             if wave_avg < 2:
                 modifier += 4.0
             elif wave_avg > 4:
                 modifier -= 2.0
 
     # --- Time of day modifier (up to +3 / -1) ---
-    is_low_light = hour < 7 or hour > 18  # before 7am or after 6pm
-    is_midday = 10 <= hour <= 15
-
-    if name in _LOW_LIGHT_SPECIES:
+    if flags & _PREFERS_LOW_LIGHT:
         modifier += 3.0 if is_low_light else (-1.0 if is_midday else 0.0)
-    elif name in _DAYTIME_SPECIES:
+    elif flags & _PREFERS_DAYTIME:
         modifier += 3.0 if is_midday else (-1.0 if is_low_light else 0.0)
 
     return modifier
 
 
+def _conditions_table(
+    wind_dir: Optional[str],
+    wind_range: Optional[Tuple[float, float]],
+    wave_range: Optional[Tuple[float, float]],
+    hour: int,
+    coast: str = "east",
+) -> Tuple[float, ...]:
+    """Conditions modifier for every combination of condition flags.
+
+    Index the result with a species' ``_CONDITION_FLAGS`` entry.  The
+    modifier depends on a species only through its flags, so scoring a
+    whole catalog needs these 32 evaluations rather than one per species.
+    """
+    ctx = _conditions_context(wind_dir, wind_range, wave_range, hour, coast)
+    return tuple(_flags_modifier(flags, ctx) for flags in range(_PREFERS_DAYTIME << 1))
+
+
+def _conditions_modifier(
+    sp: Dict[str, Any],
+    wind_dir: Optional[str],
+    wind_range: Optional[Tuple[float, float]],
+    wave_range: Optional[Tuple[float, float]],
+    hour: int,
+    coast: str = "east",
+) -> float:
+    """Compute a conditions-based score modifier for a species.
+
+    Returns a value between roughly -5 and +15 based on how well current
+    wind direction, wind speed, wave height, and time of day match the
+    species' preferred conditions.
+
+    ``coast`` should be ``"east"`` for Atlantic/Gulf or ``"west"`` for Pacific.
+    """
+    name = sp["name"]
+    flags = _CONDITION_FLAGS.get(name)
+    if flags is None:
+        flags = _condition_flags(name)
+    return _flags_modifier(
+        flags, _conditions_context(wind_dir, wind_range, wave_range, hour, coast),
+    )
+
+
 # Minimum score to include a species in the forecast.
 # This filters out species that technically survive but aren't really biting.
 SPECIES_SCORE_THRESHOLD = 30
 
+# Pulls the display fields off a catalog entry in one C-level call rather
+# than one subscript per field.
+_DISPLAY_FIELDS = operator.itemgetter("name", "bait", "rig", "hook_size", "sinker")
+
 
 _MONTH_ABBREVS: Dict[str, int] = {
     "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
@@ -1392,6 +1446,64 @@ def _regulation_disallows_keep(regulation: Dict[str, str], month: int = 0) -> bo
     return False
 
 
+def _cache_key(values: Any) -> Any:
+    """Make a list/set argument hashable for a memoized call (None and str pass through)."""
+    if values is None or isinstance(values, str):
+        return values
+    return tuple(values)
+
+
+@functools.lru_cache(maxsize=256)
+def _scored_species(
+    month: int,
+    water_temp: float,
+    wind_dir: Optional[str],
+    wind_range: Optional[Tuple[float, float]],
+    wave_range: Optional[Tuple[float, float]],
+    hour: int,
+    coast: str,
+    fishing_types: Optional[Tuple[str, ...]],
+    targets: Optional[Tuple[str, ...]],
+    fish_region: str,
+) -> Tuple[Tuple[float, int], ...]:
+    """Return ``(raw score, SPECIES_DB index)`` above the threshold, best first.
+
+    The scoring half of build_species_ranking, memoized on its exact inputs
+    (sequence arguments as tuples): forecast refreshes and users sharing a
+    location and profile reuse one scoring pass.  Regulation lookups and
+    the output entries stay per call, so live regulation data is never
+    frozen in here and callers are free to mutate what they get back.
+    """
+    # For wind scoring, Hawaii uses "east" wind patterns (NE trades)
+    wind_coast = "west" if coast == "west" else "east"
+    # Same conditions for every species: evaluate them once per flag set
+    conditions = _conditions_table(wind_dir, wind_range, wave_range, hour, wind_coast)
+    # Species whose base score can't reach the threshold even with the best
+    # conditions bonus on offer are dropped before any per-species work.
+    base_floor = SPECIES_SCORE_THRESHOLD - max(conditions)
+    scored = []
+    # Temperature + season fit for every in-range, targetable species in one
+    # pass over the packed columns; out-of-range species never reach the
+    # threshold.
+    for i, base in _ranking_candidates(month, water_temp, coast):
+        if base < base_floor:
+            continue
+        sp = SPECIES_DB[i]
+        name = sp["name"]
+        # Skip species not found in this geographic region
+        if fish_region and "regions" in sp and fish_region not in sp["regions"]:
+            continue
+        # Skip species that don't match user's fishing profile
+        if not _species_matches_profile(name, fishing_types, targets):
+            continue
+        s = base + conditions[_CONDITION_FLAGS[name]]
+        if s >= SPECIES_SCORE_THRESHOLD:
+            scored.append((s, i))
+
+    scored.sort(key=lambda x: x[0], reverse=True)
+    return tuple(scored)
+
+
 def build_species_ranking(
     month: int,
     water_temp: float,
@@ -1421,41 +1533,19 @@ def build_species_ranking(
     If ``fish_region`` is provided, species with a ``regions`` list are
     filtered to only appear if the fish_region matches.
     """
-    # For wind scoring, Hawaii uses "east" wind patterns (NE trades)
-    wind_coast = "west" if coast == "west" else "east"
-    scored = []
-    for sp in SPECIES_DB:
-        # Skip species from a different coast/region
-        if sp.get("coast", "east") != coast:
-            continue
-        # Skip nuisance/bycatch species that aren't worth targeting
-        if sp["name"] in _NUISANCE_SPECIES:
-            continue
-        # Skip species not found in this geographic region
-        if fish_region and "regions" in sp and fish_region not in sp["regions"]:
-            continue
-        # Skip species that don't match user's fishing profile
-        if not _species_matches_profile(sp["name"], fishing_types, targets):
-            continue
-        s = _score_species(
-            sp, month, water_temp,
-            wind_dir=wind_dir,
-            wind_range=wind_range,
-            wave_range=wave_range,
-            hour=hour,
-            coast=wind_coast,
-        )
-        if s >= SPECIES_SCORE_THRESHOLD:
-            explanation = _get_explanation(sp, month, water_temp)
-            scored.append((s, sp, explanation))
-
-    scored.sort(key=lambda x: x[0], reverse=True)
+    scored = _scored_species(
+        month, water_temp,
+        wind_dir, _cache_key(wind_range), _cache_key(wave_range), hour, coast,
+        _cache_key(fishing_types), _cache_key(targets), fish_region,
+    )
 
     # Max possible raw score: 50 (temp) + 30 (season) + 15 (conditions) = 95
     _MAX_RAW_SCORE = 95.0
+    season = _SEASON_BY_MONTH[month]
 
     result: List[Dict[str, Any]] = []
-    for score, sp, explanation in scored:
+    for score, i in scored:
+        sp = SPECIES_DB[i]
         if score >= 65:
             activity = "Hot"
         elif score >= 50:
@@ -1463,10 +1553,12 @@ def build_species_ranking(
         else:
             activity = "Possible"
 
+        name, bait, rig, hook_size, sinker = _DISPLAY_FIELDS(sp)
+
         # Attach regulation data and check for closures before building entry
         regulation = None
         if state:
-            reg = lookup_regulation(sp["name"], state)
+            reg = lookup_regulation(name, state)
             if reg:
                 if _regulation_disallows_keep(reg, month):
                     continue
@@ -1477,14 +1569,15 @@ def build_species_ranking(
 
         entry: Dict[str, Any] = {
             "rank": len(result) + 1,
-            "name": sp["name"],
+            "name": name,
             "score": display_score,
             "activity": activity,
-            "explanation": explanation,
-            "bait": sp["bait"],
-            "rig": sp["rig"],
-            "hook_size": sp["hook_size"],
-            "sinker": sp["sinker"],
+            # Only the species that make the final list need their prose
+            "explanation": _get_explanation(sp, season, water_temp),
+            "bait": bait,
+            "rig": rig,
+            "hook_size": hook_size,
+            "sinker": sinker,
         }
 
         if regulation:
@@ -1497,65 +1590,120 @@ def build_species_ranking(
     return result
 
 
-def build_bait_ranking(
-    species_ranking: List[Dict[str, Any]],
-    month: int,
-) -> List[Dict[str, str]]:
-    """Rank baits by relevance to the current top species and season.
+_RANK_FIELDS = operator.itemgetter("name", "rank")
 
-    Baits whose target species rank highly are scored higher.  Baits that are
-    out of season (``available_months``) receive a penalty so anglers see what
-    they can actually get right now.  Season-specific notes override defaults.
-    """
-    season = _get_season(month)
 
-    # Map species short names to their rank for quick lookup.
-    species_ranks: Dict[str, int] = {}
-    for sp in species_ranking:
-        short = sp["name"].split("(")[0].strip()
-        species_ranks[short] = sp["rank"]
-
-    def canonical_bait_name(name: str) -> str:
-        """Return a canonical label for de-duplicating near-identical bait names."""
-        cleaned = " ".join(name.lower().replace("-", " ").split())
-        alias_map = {
-            "cut squid strips": "squid strips",
-        }
-        return alias_map.get(cleaned, cleaned)
+def _canonical_bait_name(name: str) -> str:
+    """Return a canonical label for de-duplicating near-identical bait names."""
+    cleaned = " ".join(name.lower().replace("-", " ").split())
+    alias_map = {
+        "cut squid strips": "squid strips",
+    }
+    return alias_map.get(cleaned, cleaned)
 
-    scored_baits: List[Tuple[float, Dict[str, str]]] = []
-    for bait_entry in BAIT_DB:
-        bait_score = 0.0
-        for target in bait_entry["targets"]:
-            rank = species_ranks.get(target)
-            if rank is not None:
-                bait_score += max(0, 20 - rank)
 
+def _bait_month_rows(month: int) -> Tuple[Tuple[float, Tuple[str, str], str], ...]:
+    """Resolve every BAIT_DB entry for *month*.
+
+    Each row is ``(season multiplier, (bait, notes), canonical name)``:
+    out-of-season baits score at a quarter weight and the notes
+    are already the season-specific text where one exists.
+    """
+    season = _get_season(month)
+    rows = []
+    for bait_entry in BAIT_DB:
         # Penalise out-of-season baits so in-season options float to the top
         available = bait_entry.get("available_months")
-        if available and month not in available:
-            bait_score *= 0.25
+        multiplier = 0.25 if available and month not in available else 1.0
 
         # Pick season-specific notes when available
-        notes = bait_entry["notes"]
-        seasonal_notes = bait_entry.get("notes_seasonal", {})
-        if season in seasonal_notes:
-            notes = seasonal_notes[season]
+        notes = bait_entry.get("notes_seasonal", {}).get(season, bait_entry["notes"])
+
+        rows.append((
+            multiplier,
+            (bait_entry["bait"], notes),
+            _canonical_bait_name(bait_entry["bait"]),
+        ))
+    return tuple(rows)
+
+
+# BAIT_DB is constant, so availability, seasonal notes and canonical names
+# are resolved per month once instead of on every ranking.
+_BAIT_ROWS_BY_MONTH = (None,) + tuple(_bait_month_rows(m) for m in range(1, 13))
+
+# Target species short name -> BAIT_DB rows that list it (once per listing),
+# so a ranking of ten species touches only the baits those species use.
+_BAITS_BY_TARGET: Dict[str, Tuple[int, ...]] = {}
+for _j, _bait_entry in enumerate(BAIT_DB):
+    for _target in _bait_entry["targets"]:
+        _BAITS_BY_TARGET[_target] = _BAITS_BY_TARGET.get(_target, ()) + (_j,)
+
+# Catalog name -> the short name bait targets use ("Red drum (puppy drum)"
+# -> "Red drum"), split once here instead of on every bait ranking.
+_SHORT_NAMES: Dict[str, str] = {
+    sp["name"]: sp["name"].split("(")[0].strip() for sp in SPECIES_DB
+}
+
 
-        scored_baits.append((bait_score, {"bait": bait_entry["bait"], "notes": notes}))
+@functools.lru_cache(maxsize=128)
+def _bait_ranking(
+    month: int, ranked: Tuple[Tuple[str, int], ...],
+) -> Tuple[Tuple[str, str], ...]:
+    """Return de-duplicated ``(bait, notes)`` pairs, best first.
+
+    Keyed on the month and the ranking's ``(name, rank)`` pairs, the only
+    parts of the ranking the scoring reads; BAIT_DB is constant, so a
+    repeat forecast for the same ranking reuses the whole pass.
+    """
+    # Map species short names to their rank for quick lookup.
+    species_ranks: Dict[str, int] = {}
+    for name, rank in ranked:
+        short = _SHORT_NAMES.get(name)
+        if short is None:
+            short = name.split("(")[0].strip()
+        species_ranks[short] = rank
+
+    # Scatter each ranked species' weight onto the baits that target it
+    # rather than probing every bait's target list.
+    bait_scores = [0.0] * len(BAIT_DB)
+    for short, rank in species_ranks.items():
+        weight = max(0, 20 - rank)
+        for j in _BAITS_BY_TARGET.get(short, ()):
+            bait_scores[j] += weight
+
+    scored_baits: List[Tuple[float, Tuple[str, str], str]] = [
+        (bait_score * multiplier, bait, key)
+        for bait_score, (multiplier, bait, key) in zip(bait_scores, _BAIT_ROWS_BY_MONTH[month])
+    ]
 
     scored_baits.sort(key=lambda x: x[0], reverse=True)
 
-    deduped_rankings: List[Dict[str, str]] = []
+    deduped_rankings: List[Tuple[str, str]] = []
     seen_baits: set[str] = set()
-    for _, bait in scored_baits:
-        key = canonical_bait_name(bait["bait"])
+    for _, bait, key in scored_baits:
         if key in seen_baits:
             continue
         seen_baits.add(key)
         deduped_rankings.append(bait)
 
-    return deduped_rankings
+    return tuple(deduped_rankings)
+
+
+def build_bait_ranking(
+    species_ranking: List[Dict[str, Any]],
+    month: int,
+) -> List[Dict[str, str]]:
+    """Rank baits by relevance to the current top species and season.
+
+    Baits whose target species rank highly are scored higher.  Baits that are
+    out of season (``available_months``) receive a penalty so anglers see what
+    they can actually get right now.  Season-specific notes override defaults.
+    """
+    ranked = tuple(_RANK_FIELDS(sp) for sp in species_ranking)
+    return [
+        {"bait": bait, "notes": notes}
+        for bait, notes in _bait_ranking(month, ranked)
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -1564,43 +1712,43 @@ def build_bait_ranking(
 
 NATURAL_BAIT_DB: List[Dict[str, Any]] = [
     # Atlantic / Gulf
-    {"name": "Menhaden (bunker)", "months": [3,4,5,6,7,8,9,10,11], "coast": "east",
+    {"name": "Menhaden (bunker)", "months": frozenset({3,4,5,6,7,8,9,10,11}), "coast": "east",
      "note": "Schools visible at surface — look for diving birds"},
-    {"name": "Mullet", "months": [1,2,3,4,5,6,7,8,9,10,11,12], "coast": "east",
+    {"name": "Mullet", "months": frozenset({1,2,3,4,5,6,7,8,9,10,11,12}), "coast": "east",
      "note": "Year-round; large fall runs Sept-Nov along beaches"},
-    {"name": "Sand fleas (mole crabs)", "months": [4,5,6,7,8,9,10], "coast": "east",
+    {"name": "Sand fleas (mole crabs)", "months": frozenset({4,5,6,7,8,9,10}), "coast": "east",
      "note": "Dig in wet sand at surf's edge during wave retreat"},
-    {"name": "Shrimp", "months": [4,5,6,7,8,9,10,11], "coast": "east",
+    {"name": "Shrimp", "months": frozenset({4,5,6,7,8,9,10,11}), "coast": "east",
      "note": "Peak summer/fall; run on outgoing tides at night"},
-    {"name": "Fiddler crabs", "months": [4,5,6,7,8,9,10], "coast": "east",
+    {"name": "Fiddler crabs", "months": frozenset({4,5,6,7,8,9,10}), "coast": "east",
      "note": "Found in mud flats at low tide — top sheepshead bait"},
-    {"name": "Bloodworms", "months": [1,2,3,4,5,6,7,8,9,10,11,12], "coast": "east",
+    {"name": "Bloodworms", "months": frozenset({1,2,3,4,5,6,7,8,9,10,11,12}), "coast": "east",
      "note": "Available year-round at bait shops; pricey but effective"},
-    {"name": "Cut bait (spot/croaker)", "months": [5,6,7,8,9,10], "coast": "east",
+    {"name": "Cut bait (spot/croaker)", "months": frozenset({5,6,7,8,9,10}), "coast": "east",
      "note": "Catch small spot/croaker on Sabiki rigs for fresh cut bait"},
-    {"name": "Finger mullet", "months": [6,7,8,9,10,11], "coast": "east",
+    {"name": "Finger mullet", "months": frozenset({6,7,8,9,10,11}), "coast": "east",
      "note": "Cast net along shore; top live bait for predator species"},
-    {"name": "Silversides", "months": [3,4,5,6,7,8,9,10,11], "coast": "east",
+    {"name": "Silversides", "months": frozenset({3,4,5,6,7,8,9,10,11}), "coast": "east",
      "note": "Tiny baitfish in surf zone — match with small spoons/jigs"},
-    {"name": "Blue crab", "months": [4,5,6,7,8,9,10,11], "coast": "east",
+    {"name": "Blue crab", "months": frozenset({4,5,6,7,8,9,10,11}), "coast": "east",
      "note": "Cut in half for drum/sheepshead; chicken necks to trap"},
 
     # Pacific
-    {"name": "Sand crabs", "months": [3,4,5,6,7,8,9,10,11], "coast": "west",
+    {"name": "Sand crabs", "months": frozenset({3,4,5,6,7,8,9,10,11}), "coast": "west",
      "note": "Dig at wave line for prime surfperch and corbina bait"},
-    {"name": "Mussels", "months": [1,2,3,4,5,6,7,8,9,10,11,12], "coast": "west",
+    {"name": "Mussels", "months": frozenset({1,2,3,4,5,6,7,8,9,10,11,12}), "coast": "west",
      "note": "Pry from rocks at low tide — excellent all-purpose bait"},
-    {"name": "Anchovies", "months": [3,4,5,6,7,8,9,10,11], "coast": "west",
+    {"name": "Anchovies", "months": frozenset({3,4,5,6,7,8,9,10,11}), "coast": "west",
      "note": "Buy live or use Sabiki rig; top live bait for gamefish"},
-    {"name": "Sardines", "months": [4,5,6,7,8,9,10], "coast": "west",
+    {"name": "Sardines", "months": frozenset({4,5,6,7,8,9,10}), "coast": "west",
      "note": "Available live at bait barges; great for halibut and bass"},
-    {"name": "Squid", "months": [1,2,3,4,5,10,11,12], "coast": "west",
+    {"name": "Squid", "months": frozenset({1,2,3,4,5,10,11,12}), "coast": "west",
      "note": "Market squid runs in winter; cut strips or use whole"},
-    {"name": "Ghost shrimp", "months": [1,2,3,4,5,6,7,8,9,10,11,12], "coast": "west",
+    {"name": "Ghost shrimp", "months": frozenset({1,2,3,4,5,6,7,8,9,10,11,12}), "coast": "west",
      "note": "Pump from mudflats at low tide; perch and surfperch love them"},
-    {"name": "Mackerel (bait)", "months": [4,5,6,7,8,9,10], "coast": "west",
+    {"name": "Mackerel (bait)", "months": frozenset({4,5,6,7,8,9,10}), "coast": "west",
      "note": "Catch on Sabiki rigs at piers; cut for halibut and bass"},
-    {"name": "Grunion", "months": [3,4,5,6,7,8], "coast": "west",
+    {"name": "Grunion", "months": frozenset({3,4,5,6,7,8}), "coast": "west",
      "note": "Beach spawning runs on full/new moon nights — check regulations"},
 ]
 
@@ -1737,6 +1885,33 @@ _NOTABLE_SPECIES_BY_REGION: Dict[str, List[str]] = {
 }
 
 
+@functools.lru_cache(maxsize=1024)
+def _calendar_levels(i: int, monthly_temps: Tuple[float, ...]) -> Tuple[str, ...]:
+    """Calendar level ("peak", "good" or "") of SPECIES_DB[i] for months 1-12.
+
+    *monthly_temps* holds the regional average water temp for each month,
+    or is empty when unknown.  Both inputs are fixed per location, so each
+    species' row is worked out once and reused across refreshes.
+    """
+    sp = SPECIES_DB[i]
+    levels = []
+    for m in range(1, 13):
+        # Check if water temp makes this species viable this month
+        if monthly_temps:
+            t = monthly_temps[m - 1]
+            if t < sp["temp_min"] - 5 or t > sp["temp_max"] + 5:
+                levels.append("")
+                continue
+
+        if m in sp["peak_months"]:
+            levels.append("peak")
+        elif m in sp["good_months"]:
+            levels.append("good")
+        else:
+            levels.append("")
+    return tuple(levels)
+
+
 def build_species_calendar(
     species_list: List[Dict[str, Any]],
     location: Optional[Dict[str, Any]] = None,
@@ -1763,13 +1938,12 @@ def build_species_calendar(
     Temperature feasibility is also considered: months where the regional
     average water temp falls outside the species' temp range are marked empty.
     """
-    # Build a name → SPECIES_DB entry lookup
-    db_map: Dict[str, Dict[str, Any]] = {sp["name"]: sp for sp in SPECIES_DB}
-
     # Get regional water temps (12 months) for temp filtering
-    monthly_temps: Dict[int, float] = {}
+    monthly_temps: Tuple[float, ...] = ()
     if location:
-        monthly_temps = get_monthly_water_temps(location)
+        by_month = get_monthly_water_temps(location)
+        if by_month:
+            monthly_temps = tuple(by_month.get(m, 65) for m in range(1, 13))
 
     # Determine which species to show on the calendar
     if fish_region and fish_region in _NOTABLE_SPECIES_BY_REGION:
@@ -1779,25 +1953,13 @@ def build_species_calendar(
 
     calendar: List[Dict[str, Any]] = []
     for ranked_sp in source:
-        sp = db_map.get(ranked_sp["name"])
-        if not sp:
+        i = SPECIES_BY_NAME.get(ranked_sp["name"])
+        if i is None:
             continue
-        months = []
-        for m in range(1, 13):
-            # Check if water temp makes this species viable this month
-            if monthly_temps:
-                t = monthly_temps.get(m, 65)
-                if t < sp["temp_min"] - 5 or t > sp["temp_max"] + 5:
-                    months.append({"abbr": _MONTH_ABBR[m - 1], "level": ""})
-                    continue
-
-            if m in sp.get("peak_months", []):
-                level = "peak"
-            elif m in sp.get("good_months", []):
-                level = "good"
-            else:
-                level = ""
-            months.append({"abbr": _MONTH_ABBR[m - 1], "level": level})
+        months = [
+            {"abbr": abbr, "level": level}
+            for abbr, level in zip(_MONTH_ABBR, _calendar_levels(i, monthly_temps))
+        ]
 
         calendar.append({
             "name": ranked_sp["name"],
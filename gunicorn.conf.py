@@ -0,0 +1,15 @@
+"""Gunicorn settings for production: ``gunicorn -c gunicorn.conf.py app:app``.
+
+``preload_app`` imports the app once in the master before forking, so
+the species catalog and its indexes are parsed a single time and shared
+copy-on-write by every worker instead of being rebuilt per worker on
+start and respawn.  Nothing that must not cross a fork runs at import:
+SQLite connections are opened per call, and the refresh worker, the
+sweeper and the upstream fetch executor only start threads on first use.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5757')}"
+workers = int(os.environ.get("WEB_CONCURRENCY", "2"))
+preload_app = True
@@ -11,6 +11,7 @@ import json
 import logging
 import os
 import re
+import sys
 from datetime import date
 from pathlib import Path
 from threading import Lock
@@ -114,7 +115,9 @@ def _build_default_name_map() -> Dict[str, str]:
         name = str(entry.get("name") or "").strip()
         if not name:
             continue
-        key = _normalize_species_name(name)
+        # Catalog names are already interned by the loader; interning the
+        # keys too lets the state-table lookups below match by identity.
+        key = sys.intern(_normalize_species_name(name))
         default_map[name] = key
     return default_map
 
@@ -149,8 +152,8 @@ def _load_data_file() -> _RegData:
     if isinstance(custom_name_map, dict):
         for name, key in custom_name_map.items():
             if isinstance(name, str) and isinstance(key, str) and name.strip() and key.strip():
-                clean_name = name.strip()
-                clean_key = key.strip()
+                clean_name = sys.intern(name.strip())
+                clean_key = sys.intern(key.strip())
                 data.name_map[clean_name] = clean_key
                 for variant in _species_name_variants(clean_name):
                     data.normalized_name_map[variant] = clean_key
@@ -166,7 +169,7 @@ def _load_data_file() -> _RegData:
             for species_key, details in regs.items():
                 if not isinstance(species_key, str) or not isinstance(details, dict):
                     continue
-                normalized_states[st_key][species_key.strip()] = {
+                normalized_states[st_key][sys.intern(species_key.strip())] = {
                     "min_size": str(details.get("min_size") or "").strip(),
                     "bag_limit": str(details.get("bag_limit") or "").strip(),
                     "season": str(details.get("season") or "").strip(),
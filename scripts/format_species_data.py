@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Rewrite storage/species_data.json in its canonical compact layout.
+
+The catalog is hand-edited, so this keeps it consistently formatted:
+two-space indented objects with the short month arrays kept on one line
+(``"peak_months": [3, 4, 5]``) instead of one element per line.  That
+leaves about a third fewer lines to scan when editing and a smaller file
+for the loader to read and decode at startup.
+
+Usage:
+    python scripts/format_species_data.py          # rewrite in place
+    python scripts/format_species_data.py --check  # exit 1 if not canonical
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sys
+from pathlib import Path
+
+# Allow running from the project root or from the scripts/ dir
+_HERE = Path(__file__).resolve().parent
+_ROOT = _HERE.parent
+sys.path.insert(0, str(_ROOT))
+
+from storage.species_loader import _JSON_PATH, load_species_db
+
+# A JSON array containing only integers, as emitted by json.dumps(indent=2).
+_INT_ARRAY_RE = re.compile(r"\[\s+(-?\d+(?:,\s+-?\d+)*)\s+\]")
+
+
+def render(entries: list) -> str:
+    """Serialize *entries* in the canonical layout."""
+    text = json.dumps(entries, indent=2, ensure_ascii=False)
+    return _INT_ARRAY_RE.sub(_inline_array, text) + "\n"
+
+
+def _inline_array(match: re.Match) -> str:
+    values = match.group(1).replace(",", " ").split()
+    return "[" + ", ".join(values) + "]"
+
+
+def main(argv: list) -> int:
+    entries = load_species_db()
+    canonical = render(entries)
+    current = _JSON_PATH.read_text(encoding="utf-8")
+
+    if "--check" in argv:
+        if current != canonical:
+            print(f"{_JSON_PATH} is not in canonical format; run scripts/format_species_data.py")
+            return 1
+        return 0
+
+    if current != canonical:
+        _JSON_PATH.write_text(canonical, encoding="utf-8")
+        print(f"Rewrote {_JSON_PATH} ({len(entries)} species)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
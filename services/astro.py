@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import math
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
 from zoneinfo import ZoneInfo
@@ -12,16 +13,34 @@ from zoneinfo import ZoneInfo
 logger = logging.getLogger(__name__)
 
 _DEFAULT_TZ = "America/New_York"
+_UTC = ZoneInfo("UTC")
 
 
-def _safe_zone(tz_name: str) -> ZoneInfo:
+@functools.cache
+def safe_zone(tz_name: str) -> ZoneInfo:
+    """Return ZoneInfo for *tz_name*, falling back to Eastern if it's invalid.
+
+    Shared by the astronomy, NOAA and forecast code; cached because every
+    forecast build resolves the same handful of location time zones.
+    """
     try:
         return ZoneInfo(tz_name)
     except Exception:
         if tz_name != _DEFAULT_TZ:
-            logger.warning("Invalid timezone %r in astro; using %s", tz_name, _DEFAULT_TZ)
+            logger.warning("Invalid timezone %r; using %s", tz_name, _DEFAULT_TZ)
         return ZoneInfo(_DEFAULT_TZ)
 
+
+def format_clock_time(value: datetime) -> str:
+    """Format a time as ``6:05 AM``.
+
+    Portable equivalent of ``strftime("%-I:%M %p")``: the ``%-I`` flag is a
+    glibc extension and raises or misformats on other platforms.
+    """
+    hour = value.hour % 12 or 12
+    return f"{hour}:{value.minute:02d} {'AM' if value.hour < 12 else 'PM'}"
+
+
 # Default coordinates (overridden per location; only used when no location set)
 _LAT = 34.2104
 _LNG = -77.7964
@@ -39,14 +58,28 @@ def _sun_times(
     and an approximate equation of time.  Returns (sunrise, sunset) as
     timezone-aware datetimes.  Accuracy is within a few minutes -- good
     enough for fishing planning.
+
+    Only the calendar date of *dt* matters, so results are memoized per
+    (date, location): every forecast, outlook day and solunar window for a
+    location on a given day shares one computation.
     """
+    return _sun_times_for_date(dt.date(), lat, lng, tz_name)
+
+
+@functools.lru_cache(maxsize=256)
+def _sun_times_for_date(
+    day: date,
+    lat: float,
+    lng: float,
+    tz_name: str,
+) -> Tuple[datetime, datetime]:
     if lat == 0:
         lat = _LAT
     if lng == 0:
         lng = _LNG
-    tz = _safe_zone(tz_name)
+    tz = safe_zone(tz_name)
     # Day of year (1-365)
-    n = dt.timetuple().tm_yday
+    n = day.timetuple().tm_yday
 
     # Fractional year in radians
     gamma = 2 * math.pi / 365 * (n - 1)
@@ -86,7 +119,7 @@ def _sun_times(
     sunrise_utc = 720 - 4 * (lng + ha) - eqtime
     sunset_utc = 720 - 4 * (lng - ha) - eqtime
 
-    base = datetime(dt.year, dt.month, dt.day, tzinfo=ZoneInfo("UTC"))
+    base = datetime(day.year, day.month, day.day, tzinfo=_UTC)
     sunrise = base + timedelta(minutes=sunrise_utc)
     sunset = base + timedelta(minutes=sunset_utc)
 
@@ -96,9 +129,9 @@ def _sun_times(
 def _moon_phase(dt: datetime) -> float:
     """Return the moon phase as a fraction (0.0 = new, 0.5 = full)."""
     # Reference new moon: 2000-01-06 18:14 UTC
-    ref = datetime(2000, 1, 6, 18, 14, tzinfo=ZoneInfo("UTC"))
+    ref = datetime(2000, 1, 6, 18, 14, tzinfo=_UTC)
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=ZoneInfo("UTC"))
+        dt = dt.replace(tzinfo=_UTC)
     diff = (dt - ref).total_seconds()
     synodic = 29.53058867  # days
     phase = (diff / (synodic * 86400)) % 1.0
@@ -139,7 +172,7 @@ def _sun_event_time(
     rising: bool,
 ) -> datetime:
     """Compute sunrise/sunset style event for custom zenith angle."""
-    tz = _safe_zone(tz_name)
+    tz = safe_zone(tz_name)
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=tz)
     n = dt.timetuple().tm_yday
@@ -168,7 +201,7 @@ def _sun_event_time(
     cos_ha = max(-1.0, min(1.0, cos_ha))
     ha = math.degrees(math.acos(cos_ha))
     event_utc = 720 - 4 * (lng + ha if rising else lng - ha) - eqtime
-    base = datetime(dt.year, dt.month, dt.day, tzinfo=ZoneInfo("UTC"))
+    base = datetime(dt.year, dt.month, dt.day, tzinfo=_UTC)
     return (base + timedelta(minutes=event_utc)).astimezone(tz)
 
 
@@ -182,8 +215,7 @@ def compute_twilight_times(dt: datetime, lat: float, lng: float, tz_name: str) -
     astro_dusk = _sun_event_time(dt, lat, lng, tz_name, zenith_deg=108.0, rising=False)
     sunrise, sunset = _sun_times(dt, lat, lng, tz_name)
 
-    def fmt(v: datetime) -> str:
-        return v.strftime("%-I:%M %p")
+    fmt = format_clock_time
 
     return {
         "civil_dawn": fmt(civil_dawn),
@@ -199,7 +231,7 @@ def compute_twilight_times(dt: datetime, lat: float, lng: float, tz_name: str) -
 
 def compute_lunar_details(dt: datetime, lng: float, tz_name: str) -> Dict[str, Any]:
     """Compute moonrise/moonset plus simple phase-age-distance info."""
-    tz = _safe_zone(tz_name)
+    tz = safe_zone(tz_name)
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=tz)
 
@@ -244,7 +276,7 @@ def compute_solunar_times(
         moon_phase: str description (New, Waxing, Full, Waning)
         rating: str (Excellent / Good / Fair) based on moon phase
     """
-    tz = _safe_zone(tz_name)
+    tz = safe_zone(tz_name)
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=tz)
 
@@ -1,15 +1,24 @@
-"""Background forecast refresh queue (threaded, local/prototype friendly)."""
+"""Background forecast refresh queue (threaded, local/prototype friendly).
+
+Besides the on-demand queue, a sweeper thread re-queues the forecasts
+people have recently looked at shortly before they go stale, so a request
+normally finds a fresh cache row instead of waiting on (or triggering) a
+regeneration.
+"""
 
 from __future__ import annotations
 
 import logging
 import queue
+import random
 import threading
-from typing import Optional, Set, Tuple
+import time
+from typing import Dict, Optional, Set, Tuple
 
 from domain.forecast import generate_forecast
 from locations import get_location
-from storage.cache import save_forecast
+from storage.cache import expires_within, save_forecast
+from storage.sqlite import load_forecast_cache_stamp
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +30,14 @@ _refreshing: Set[QueueKey] = set()
 _enqueued: Set[QueueKey] = set()
 _worker_started = False
 
+# How often the sweeper wakes, and how long a location stays on its list
+# after the last time someone viewed it.
+SWEEP_INTERVAL_MINUTES = 15
+WATCH_TTL_HOURS = 24
+
+_watched: Dict[QueueKey, float] = {}
+_sweeper_started = False
+
 
 def _norm_user_id(user_id: Optional[int]) -> int:
     return int(user_id or 0)
@@ -84,3 +101,55 @@ def is_refreshing(location_id: str, user_id: Optional[int] = None) -> bool:
     key = (location_id, _norm_user_id(user_id))
     with _refresh_lock:
         return key in _enqueued or key in _refreshing
+
+
+def watch_forecast(location_id: str, user_id: Optional[int] = None) -> None:
+    """Keep this location/user's cached forecast warm for the next day."""
+    key = (location_id, _norm_user_id(user_id))
+    _ensure_sweeper_started()
+    with _refresh_lock:
+        _watched[key] = time.monotonic()
+
+
+def _sweep_once(now: Optional[float] = None) -> int:
+    """Queue refreshes for watched forecasts due to expire before the next sweep."""
+    now = time.monotonic() if now is None else now
+    with _refresh_lock:
+        for key, seen in list(_watched.items()):
+            if now - seen > WATCH_TTL_HOURS * 3600:
+                del _watched[key]
+        keys = list(_watched)
+
+    # The next sweep can be up to 10% late, so refresh anything that would
+    # expire before then.
+    lead = SWEEP_INTERVAL_MINUTES * 1.1
+    queued = 0
+    for location_id, normalized_uid in keys:
+        stamp = load_forecast_cache_stamp(normalized_uid, location_id)
+        if stamp is not None and not expires_within({"generated_at": stamp}, lead):
+            continue
+        if enqueue_forecast_refresh(location_id, user_id=normalized_uid or None):
+            queued += 1
+    return queued
+
+
+def _sweeper_loop() -> None:
+    while True:
+        # Jittered so worker processes started together drift apart.
+        time.sleep(SWEEP_INTERVAL_MINUTES * 60 * random.uniform(0.9, 1.1))
+        try:
+            queued = _sweep_once()
+            if queued:
+                logger.info("refresh.sweep queued=%s", queued)
+        except Exception:
+            logger.exception("refresh.sweep_failed")
+
+
+def _ensure_sweeper_started() -> None:
+    global _sweeper_started
+    with _refresh_lock:
+        if _sweeper_started:
+            return
+        sweeper = threading.Thread(target=_sweeper_loop, name="forecast-refresh-sweeper", daemon=True)
+        sweeper.start()
+        _sweeper_started = True
@@ -3,16 +3,98 @@
 from __future__ import annotations
 
 import logging
+import os
+import threading
 import time
 from typing import Any, Dict, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_TIMEOUT: Tuple[float, float] = (3.05, 10.0)
 TRANSIENT_STATUS_CODES = {429, 500, 502, 503, 504}
 
+# Most upstream requests a process makes at once.  Forecast builds fetch
+# through an executor of this size, and each host's connection pool holds
+# as many sockets, so concurrent fetches never overflow the pool and
+# discard keep-alive connections.
+UPSTREAM_CONCURRENCY = 8
+
+
+def _new_session() -> requests.Session:
+    """Session whose pooled keep-alive connections are reused across calls.
+
+    Retries stay in :func:`get` (which logs each attempt), so the adapter
+    is mounted without urllib3 retries of its own.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=UPSTREAM_CONCURRENCY)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# One session per process: repeat calls to the NWS / NOAA / NDBC hosts skip
+# the TCP and TLS handshakes.  A forked child (gunicorn preload) starts with
+# a fresh pool rather than sharing the parent's sockets.
+_session = _new_session()
+
+
+def _reset_session() -> None:
+    global _session
+    _session = _new_session()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_session)
+
+# Last successful response per URL that carried an ETag or Last-Modified.
+# Repeat GETs send those validators, and a 304 is answered with the stored
+# response, so an unchanged upstream document costs no body transfer.
+# Kept in least-recently-used order; the oldest entry is evicted when full.
+_validated_responses: Dict[str, requests.Response] = {}
+_validated_lock = threading.Lock()
+_MAX_VALIDATED_RESPONSES = 128
+
+
+def _conditional_headers(
+    url: str,
+    headers: Optional[Dict[str, str]],
+) -> Tuple[Optional[Dict[str, str]], Optional[requests.Response]]:
+    """Add If-None-Match / If-Modified-Since for a URL fetched before.
+
+    Returns the headers to send and the stored response they were built
+    from, which is what a ``304`` for this request refers to.
+    """
+    with _validated_lock:
+        previous = _validated_responses.pop(url, None)
+        if previous is not None:
+            _validated_responses[url] = previous
+    if previous is None:
+        return headers, None
+    merged = dict(headers or {})
+    etag = previous.headers.get("ETag")
+    if etag:
+        merged["If-None-Match"] = etag
+    last_modified = previous.headers.get("Last-Modified")
+    if last_modified:
+        merged["If-Modified-Since"] = last_modified
+    return merged, previous
+
+
+def _remember(url: str, response: requests.Response) -> None:
+    if response.status_code != 200:
+        return
+    if not (response.headers.get("ETag") or response.headers.get("Last-Modified")):
+        return
+    with _validated_lock:
+        _validated_responses.pop(url, None)
+        if len(_validated_responses) >= _MAX_VALIDATED_RESPONSES:
+            del _validated_responses[next(iter(_validated_responses))]
+        _validated_responses[url] = response
+
 
 def get(
     url: str,
@@ -23,16 +105,31 @@ def get(
     retries: int = 2,
     backoff_s: float = 0.25,
 ) -> requests.Response:
-    """GET with bounded timeout and retry/backoff for transient failures."""
+    """GET with bounded timeout and retry/backoff for transient failures.
+
+    Requests are made conditional when an earlier response for *url* had
+    validators; a ``304 Not Modified`` returns that earlier response.
+    """
     last_error: Optional[Exception] = None
+    headers, previous = _conditional_headers(url, headers)
 
     for attempt in range(1, retries + 2):
         start = time.perf_counter()
         try:
-            response = requests.get(url, headers=headers, timeout=timeout)
+            response = _session.get(url, headers=headers, timeout=timeout)
             latency_ms = round((time.perf_counter() - start) * 1000, 1)
             status = response.status_code
 
+            if status == 304:
+                if previous is not None:
+                    logger.info(
+                        "external_call.not_modified endpoint=%s latency_ms=%s attempt=%s",
+                        endpoint,
+                        latency_ms,
+                        attempt,
+                    )
+                    return previous
+
             if status in TRANSIENT_STATUS_CODES and attempt <= retries:
                 logger.warning(
                     "external_call.retry endpoint=%s attempt=%s status=%s latency_ms=%s",
@@ -52,6 +149,7 @@ def get(
                 latency_ms,
                 attempt,
             )
+            _remember(url, response)
             return response
         except requests.RequestException as exc:
             last_error = exc
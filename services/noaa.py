@@ -7,24 +7,13 @@ import logging
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
+from services.astro import format_clock_time, safe_zone
 from services.http_client import get as http_get
-from zoneinfo import ZoneInfo
 
 from locations import get_monthly_water_temps
 
 logger = logging.getLogger(__name__)
 
-_DEFAULT_TZ = "America/New_York"
-
-
-def _safe_zone(tz_name: str) -> ZoneInfo:
-    """Return ZoneInfo for *tz_name*, falling back to Eastern if invalid."""
-    try:
-        return ZoneInfo(tz_name)
-    except Exception:
-        if tz_name != _DEFAULT_TZ:
-            logger.warning("Invalid timezone %r; using %s", tz_name, _DEFAULT_TZ)
-        return ZoneInfo(_DEFAULT_TZ)
 
 _COOPS_HEADERS = {
     "User-Agent": "(SurfPierForecast, github.com/ConnnnerDay/surf-pier-forecast)",
@@ -121,7 +110,7 @@ def fetch_coops_environmental_metrics(station_id: str) -> Dict[str, float]:
 
 def fetch_currents_predictions(station_id: str, tz_name: str = "America/New_York") -> List[Dict[str, str]]:
     """Fetch NOAA CO-OPS current prediction events (flood/ebb/slack)."""
-    tz = _safe_zone(tz_name)
+    tz = safe_zone(tz_name)
     now = datetime.now(tz)
     today_str = now.strftime("%Y%m%d")
     tomorrow_str = (now + timedelta(days=1)).strftime("%Y%m%d")
@@ -145,7 +134,7 @@ def fetch_currents_predictions(station_id: str, tz_name: str = "America/New_York
                 continue
             try:
                 dt = datetime.strptime(raw, "%Y-%m-%d %H:%M").replace(tzinfo=tz)
-                when = dt.strftime("%-I:%M %p")
+                when = format_clock_time(dt)
             except Exception:
                 when = raw
             out.append({
@@ -160,7 +149,7 @@ def fetch_currents_predictions(station_id: str, tz_name: str = "America/New_York
 
 def fetch_currents_observation(station_id: str, tz_name: str = "America/New_York") -> Optional[Dict[str, str]]:
     """Fetch latest measured current speed/direction from NOAA CO-OPS."""
-    tz = _safe_zone(tz_name)
+    tz = safe_zone(tz_name)
     url = (
         "https://api.tidesandcurrents.noaa.gov/api/prod/datagetter"
         f"?date=latest&station={station_id}"
@@ -182,7 +171,7 @@ def fetch_currents_observation(station_id: str, tz_name: str = "America/New_York
         if raw_time:
             try:
                 dt = datetime.strptime(raw_time, "%Y-%m-%d %H:%M").replace(tzinfo=tz)
-                when = dt.strftime("%-I:%M %p")
+                when = format_clock_time(dt)
             except Exception:
                 when = str(raw_time)
 
@@ -264,7 +253,7 @@ def fetch_tide_predictions(
         [{"time": "6:32 AM", "type": "High", "height_ft": "5.2"}, ...]
     Returns an empty list on any error.
     """
-    tz = _safe_zone(tz_name)
+    tz = safe_zone(tz_name)
     now = datetime.now(tz)
     today_str = now.strftime("%Y%m%d")
     tomorrow_str = (now + timedelta(days=1)).strftime("%Y%m%d")
@@ -289,7 +278,7 @@ def fetch_tide_predictions(
             try:
                 dt = datetime.strptime(raw_time, "%Y-%m-%d %H:%M")
                 dt = dt.replace(tzinfo=tz)
-                time_str = dt.strftime("%-I:%M %p")
+                time_str = format_clock_time(dt)
             except Exception:
                 time_str = raw_time
             tides.append({
@@ -22,6 +22,23 @@ _DIR_MAP: dict = {
     "east": "E", "west": "W", "variable": "VARIABLE",
 }
 
+# Patterns for the NWS forecast text, compiled once at import.
+_MPH_RE = re.compile(r"(\d+)(?:\s*to\s*(\d+))?\s*mph", re.IGNORECASE)
+# Wind direction -- both abbreviated (SW, NE) and spelled out (Southwest,
+# Northeast) forms that the NWS API may return.
+_WIND_DIR_RE = re.compile(
+    r"(north(?:east|west)?|south(?:east|west)?|east|west|"
+    r"NE|NW|SE|SW|N|E|S|W|VARIABLE)\s+wind",
+    re.IGNORECASE,
+)
+# Wind speed -- "10 to 15 kt", "10 to 15 knots", "around 10 kt", etc.
+_WIND_SPEED_RE = re.compile(r"(\d+)(?:\s*to\s*(\d+))?\s*(?:kt|knots?)", re.IGNORECASE)
+# Sea/wave height -- "seas 2 to 3 ft", "seas around 2 feet", "waves 1 to 2 ft", etc.
+_SEA_HEIGHT_RE = re.compile(
+    r"(?:seas?|waves?)\s*(?:around\s+)?(\d+)(?:\s*to\s*(\d+))?\s*(?:ft|feet|foot)",
+    re.IGNORECASE,
+)
+
 # Default coordinates (overridden per location)
 _LAT = 34.2104
 _LNG = -77.7964
@@ -79,7 +96,7 @@ def _try_nws_gridpoint(
         ws = period.get("windSpeed", "")
         wd = period.get("windDirection", "")
 
-        m = re.search(r"(\d+)(?:\s*to\s*(\d+))?\s*mph", ws, re.IGNORECASE)
+        m = _MPH_RE.search(ws)
         if m:
             low = float(m.group(1)) * _MPH_TO_KNOTS
             high = float(m.group(2)) * _MPH_TO_KNOTS if m.group(2) else low
@@ -114,34 +131,18 @@ def parse_conditions(
     for period in periods[:3]:
         text = period.get("detailedForecast", "")
 
-        # Wind direction -- handle both abbreviated (SW, NE) and spelled out
-        # (Southwest, Northeast) forms that the NWS API may return.
-        dir_match = re.search(
-            r"(north(?:east|west)?|south(?:east|west)?|east|west|"
-            r"NE|NW|SE|SW|N|E|S|W|VARIABLE)\s+wind",
-            text, re.IGNORECASE,
-        )
+        dir_match = _WIND_DIR_RE.search(text)
         if dir_match:
             raw = dir_match.group(1)
             wind_directions.append(_DIR_MAP.get(raw.lower(), raw.upper()))
 
-        # Wind speed -- match "10 to 15 kt", "10 to 15 knots",
-        # "around 10 kt", "around 10 knots", etc.
-        wind_match = re.search(
-            r"(\d+)(?:\s*to\s*(\d+))?\s*(?:kt|knots?)",
-            text, re.IGNORECASE,
-        )
+        wind_match = _WIND_SPEED_RE.search(text)
         if wind_match:
             low = float(wind_match.group(1))
             high = float(wind_match.group(2)) if wind_match.group(2) else low
             wind_ranges.append((low, high))
 
-        # Sea/wave height -- match "seas 2 to 3 ft", "seas 2 to 3 feet",
-        # "seas around 2 feet", "waves 1 to 2 ft", etc.
-        sea_match = re.search(
-            r"(?:seas?|waves?)\s*(?:around\s+)?(\d+)(?:\s*to\s*(\d+))?\s*(?:ft|feet|foot)",
-            text, re.IGNORECASE,
-        )
+        sea_match = _SEA_HEIGHT_RE.search(text)
         if sea_match:
             low = float(sea_match.group(1))
             high = float(sea_match.group(2)) if sea_match.group(2) else low
@@ -4,26 +4,39 @@ Public API (unchanged):
     load_cached_forecast(location_id, user_id=None) -> dict | None
     save_forecast(data, location_id, user_id=None) -> None
     _forecast_age_minutes(forecast) -> float | None
+    _max_age_minutes(forecast) -> float
     _human_age(minutes) -> str
     CACHE_MAX_AGE_HOURS
 """
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
+import marshal
 import os
+import threading
+import zlib
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from zoneinfo import ZoneInfo
 
 logger = logging.getLogger(__name__)
 
+# Cached forecasts are stamped in Eastern time.
+_EASTERN = ZoneInfo("America/New_York")
+
 # Maximum age (in hours) before a cached forecast is considered stale
 # and automatically refreshed on the next page load.
 CACHE_MAX_AGE_HOURS = 4
 
+# Each forecast goes stale at a point spread +/- this fraction around
+# CACHE_MAX_AGE_HOURS, so forecasts generated together don't all expire
+# (and hit the upstream APIs) in the same minute.
+CACHE_MAX_AGE_JITTER = 0.125
+
 # Legacy JSON cache directory (kept for migration / fallback reads)
 CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
 os.makedirs(CACHE_DIR, exist_ok=True)
@@ -38,9 +51,37 @@ def _norm_user_id(user_id: Optional[int]) -> int:
     return int(user_id or 0)
 
 
+# Process-local copies of forecast_cache rows: (user_id, location_id) ->
+# (generated_at, marshalled document).  A stamp-only query confirms the row
+# is unchanged (another worker may have saved since), and marshal.loads
+# hands each caller its own mutable copy several times faster than parsing
+# the stored JSON again.
+_PARSED_ROWS: Dict[Tuple[int, str], Tuple[str, bytes]] = {}
+_MAX_PARSED_ROWS = 256
+
+
+def _load_cache_row(user_id: int, location_id: str) -> Optional[Dict[str, Any]]:
+    """``load_forecast_cache`` backed by the process-local parsed copies."""
+    from storage.sqlite import load_forecast_cache, load_forecast_cache_stamp
+    key = (user_id, location_id)
+    entry = _PARSED_ROWS.get(key)
+    if entry is not None and load_forecast_cache_stamp(user_id, location_id) == entry[0]:
+        return marshal.loads(entry[1])
+
+    result = load_forecast_cache(user_id, location_id)
+    stamp = result.get("generated_at") if result is not None else None
+    if not isinstance(stamp, str):
+        _PARSED_ROWS.pop(key, None)
+        return result
+    if len(_PARSED_ROWS) >= _MAX_PARSED_ROWS:
+        _PARSED_ROWS.clear()
+    _PARSED_ROWS[key] = (stamp, marshal.dumps(result))
+    return result
+
+
 def _is_stale(forecast: Dict[str, Any]) -> bool:
     age = _forecast_age_minutes(forecast)
-    return bool(age is not None and age > CACHE_MAX_AGE_HOURS * 60)
+    return bool(age is not None and age > _max_age_minutes(forecast))
 
 
 def load_cached_forecast(
@@ -57,17 +98,18 @@ def load_cached_forecast(
     if not location_id:
         return _load_json_fallback(location_id)
 
-    from storage.sqlite import delete_forecast_cache, load_forecast, load_forecast_cache
+    from storage.sqlite import delete_forecast_cache, load_forecast
     normalized_uid = _norm_user_id(user_id)
-    result = load_forecast_cache(normalized_uid, location_id)
+    result = _load_cache_row(normalized_uid, location_id)
     if result is None and normalized_uid != 0:
-        result = load_forecast_cache(0, location_id)
+        result = _load_cache_row(0, location_id)
 
     if result is not None:
         if _is_stale(result):
             if include_stale:
                 return result
             delete_forecast_cache(normalized_uid, location_id)
+            _PARSED_ROWS.pop((normalized_uid, location_id), None)
             return None
         return result
 
@@ -95,6 +137,7 @@ def save_forecast(data: Dict[str, Any], location_id: str = "", user_id: Optional
     try:
         from storage.sqlite import save_forecast_cache
         save_forecast_cache(_norm_user_id(user_id), location_id, data)
+        _PARSED_ROWS.pop((_norm_user_id(user_id), location_id), None)
     except Exception as exc:
         logger.warning("DB write failed for %s, writing JSON fallback: %s", location_id, exc)
         _save_json(data, location_id)
@@ -123,19 +166,32 @@ def _load_json_fallback(location_id: str = "") -> Optional[Dict[str, Any]]:
         try:
             with open(path, "r", encoding="utf-8") as f:
                 return json.load(f)
-        except Exception:
+        except (OSError, ValueError) as exc:
+            logger.warning("Unreadable JSON cache %s: %s", path, exc)
             return None
     return None
 
 
 def _save_json(data: Dict[str, Any], location_id: str = "") -> None:
-    """Write forecast to a JSON file (backup)."""
+    """Write forecast to a JSON file (backup).
+
+    Written to a per-thread temp file and swapped in with ``os.replace``,
+    so a crash or a concurrent writer never leaves a truncated file behind.
+    """
     path = _cache_path(location_id)
+    tmp_path = f"{path}.tmp.{os.getpid()}.{threading.get_ident()}"
     try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
     except Exception as exc:
         logger.warning("Failed to write JSON backup %s: %s", path, exc)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
 
 
 def _migrate_json_to_db(location_id: str, data: Dict[str, Any], user_id: int = 0) -> None:
@@ -152,16 +208,49 @@ def _migrate_json_to_db(location_id: str, data: Dict[str, Any], user_id: int = 0
 # Age / display helpers (unchanged)
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=256)
+def _parse_generated_at(stamp: str) -> datetime:
+    """Parse a forecast's ``generated_at`` stamp, once per distinct stamp.
+
+    Every request checks its forecast's age, often several times, and a
+    cached forecast keeps the same stamp for hours.
+    """
+    return datetime.fromisoformat(stamp)
+
+
 def _forecast_age_minutes(forecast: Dict[str, Any]) -> Optional[float]:
     """Return the age of a cached forecast in minutes, or None."""
     try:
-        generated = datetime.fromisoformat(forecast["generated_at"])
-        now = datetime.now(ZoneInfo("America/New_York"))
+        generated = _parse_generated_at(forecast["generated_at"])
+        now = datetime.now(_EASTERN)
         return (now - generated).total_seconds() / 60
     except Exception:
         return None
 
 
+def expires_within(forecast: Dict[str, Any], minutes: float) -> bool:
+    """True if *forecast* is stale now or will be within *minutes*.
+
+    A forecast without a parseable ``generated_at`` counts as expiring.
+    """
+    age = _forecast_age_minutes(forecast)
+    return age is None or age + minutes >= _max_age_minutes(forecast)
+
+
+def _max_age_minutes(forecast: Dict[str, Any]) -> float:
+    """Return the age in minutes at which *forecast* counts as stale.
+
+    The jitter is derived from ``generated_at`` with a stable hash, so every
+    worker process agrees on when a given forecast expires.
+    """
+    base = CACHE_MAX_AGE_HOURS * 60
+    stamp = str(forecast.get("generated_at") or "")
+    if not stamp:
+        return base
+    fraction = zlib.crc32(stamp.encode("utf-8")) / 0xFFFFFFFF  # 0.0 - 1.0
+    return base * (1 + CACHE_MAX_AGE_JITTER * (2 * fraction - 1))
+
+
 def _human_age(minutes: Optional[float]) -> str:
     """Convert a duration in minutes to a human-friendly string."""
     if minutes is None:
@@ -2,15 +2,32 @@
 
 The canonical species data lives in storage/species_data.json.
 Import SPECIES_DB from this module; do NOT import it from domain.species.
+
+The JSON file is parsed directly on every start rather than through a
+prebuilt pickle/msgpack cache: decoding and validating the whole catalog
+takes a couple of milliseconds, and a second generated artifact would
+only add a way for the shipped data and the loaded data to disagree.
+
+Query-style access (by name, month, temperature, bait) is answered from
+the in-memory indexes built at the bottom of this module rather than an
+indexed SQLite copy: each lookup is already a dict hit or a short column
+scan over a few hundred rows, well under the cost of one SQL round trip.
 """
 
 from __future__ import annotations
 
 import json
+import math
 import pathlib
-from typing import Any, Dict, List
+import sys
+from array import array
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, List, Mapping, Optional, Tuple
 
 _JSON_PATH = pathlib.Path(__file__).parent / "species_data.json"
+_EXPLANATIONS_PATH = pathlib.Path(__file__).parent / "seasonal_explanations.json"
+
+_SEASONS: frozenset = frozenset({"winter", "spring", "summer", "fall"})
 
 _REQUIRED_FIELDS: frozenset = frozenset({
     "name",
@@ -23,6 +40,36 @@ _REQUIRED_FIELDS: frozenset = frozenset({
 
 _VALID_COASTS: frozenset = frozenset({"east", "west", "hawaii"})
 
+# Text fields drawn from a small vocabulary (e.g. "Hi-lo rig", "N/A") that
+# repeat across many entries, plus bait lists shared by related species.
+# The explanations are left alone: every one is unique to its species.
+_INTERNED_FIELDS: Tuple[str, ...] = ("name", "bait", "rig", "hook_size", "sinker", "coast")
+
+# Free-text fields shown to users; checked for encoding damage on load so
+# bad text is rejected once here instead of scrubbed on every render.
+_TEXT_FIELDS: Tuple[str, ...] = (
+    "name", "bait", "rig", "hook_size", "sinker",
+    "explanation_cold", "explanation_warm",
+)
+
+
+def _is_mojibake(text: Any) -> bool:
+    """True if *text* is UTF-8 that was mis-decoded as Latin-1/CP1252.
+
+    Such text (e.g. "â€”" for an em dash) re-encodes to bytes that are
+    valid UTF-8 and decode to something different, whereas correctly
+    decoded non-ASCII text does not survive that round trip.
+    """
+    if not isinstance(text, str) or text.isascii():
+        return False
+    for codec in ("cp1252", "latin-1"):
+        try:
+            if text.encode(codec).decode("utf-8") != text:
+                return True
+        except UnicodeError:
+            continue
+    return False
+
 
 def _validate(entries: List[Dict[str, Any]]) -> None:
     """Raise ValueError with a descriptive message if any entry is malformed."""
@@ -77,6 +124,13 @@ def _validate(entries: List[Dict[str, Any]]) -> None:
                         f"Species '{name}': '{field}' contains invalid month {m!r}"
                     )
 
+        for field in _TEXT_FIELDS:
+            if _is_mojibake(entry[field]):
+                raise ValueError(
+                    f"Species '{name}': '{field}' looks double-encoded "
+                    f"(UTF-8 read as Latin-1/CP1252): {entry[field]!r}"
+                )
+
         if "regions" in entry:
             regions = entry["regions"]
             if not isinstance(regions, list) or not all(isinstance(r, str) for r in regions):
@@ -102,7 +156,9 @@ def load_species_db(path: pathlib.Path | None = None) -> List[Dict[str, Any]]:
     """
     resolved = path or _JSON_PATH
     try:
-        raw = resolved.read_text(encoding="utf-8")
+        # Hand the raw bytes straight to the JSON decoder (it detects UTF-8
+        # itself) rather than materialising a decoded copy of the file first.
+        raw = resolved.read_bytes()
     except FileNotFoundError:
         raise FileNotFoundError(
             f"Species data file not found: {resolved}\n"
@@ -120,5 +176,240 @@ def load_species_db(path: pathlib.Path | None = None) -> List[Dict[str, Any]]:
     return entries
 
 
+def load_seasonal_explanations(
+    path: pathlib.Path | None = None,
+    species_names: Optional[Iterable[str]] = None,
+) -> Dict[str, Dict[str, str]]:
+    """Read and validate the per-season explanation overrides.
+
+    The file maps species name -> season ("winter", "spring", "summer",
+    "fall") -> text shown instead of the cold/warm explanation in that
+    season.  When *species_names* is given, every key must be one of them,
+    so a renamed catalog entry cannot silently lose its overrides.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the JSON file does not exist.
+    ValueError
+        If the JSON is malformed or has the wrong shape.
+    """
+    resolved = path or _EXPLANATIONS_PATH
+    try:
+        raw = resolved.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"Seasonal explanations file not found: {resolved}\n"
+            "Ensure storage/seasonal_explanations.json is present in the project root."
+        )
+
+    try:
+        data = json.loads(raw)
+    except json.JSONDecodeError as exc:
+        raise ValueError(
+            f"seasonal_explanations.json contains invalid JSON: {exc}"
+        ) from exc
+
+    if not isinstance(data, dict):
+        raise ValueError("seasonal_explanations.json must be an object keyed by species name")
+    known = None if species_names is None else frozenset(species_names)
+    for name, overrides in data.items():
+        if known is not None and name not in known:
+            raise ValueError(f"Seasonal explanations for unknown species '{name}'")
+        if not isinstance(overrides, dict):
+            raise ValueError(f"Seasonal explanations for '{name}' must be an object")
+        for season, text in overrides.items():
+            if season not in _SEASONS:
+                raise ValueError(
+                    f"Seasonal explanations for '{name}': unknown season '{season}'"
+                )
+            if not isinstance(text, str) or not text.strip():
+                raise ValueError(
+                    f"Seasonal explanations for '{name}': '{season}' must be a non-empty string"
+                )
+            if _is_mojibake(text):
+                raise ValueError(
+                    f"Seasonal explanations for '{name}': '{season}' looks double-encoded "
+                    f"(UTF-8 read as Latin-1/CP1252): {text!r}"
+                )
+    return data
+
+
+# Bit offset of the good-month half of a season mask.
+GOOD_SHIFT = 12
+
+
+def month_mask(months: Iterable[int]) -> int:
+    """Encode months (1-12) as a bitmask with bit ``m - 1`` set for month ``m``."""
+    mask = 0
+    for m in months:
+        mask |= 1 << (m - 1)
+    return mask
+
+
+def _freeze(entries: List[Dict[str, Any]]) -> Tuple[Mapping[str, Any], ...]:
+    """Wrap validated entries in read-only views.
+
+    The catalog is shared by every request and never mutated after load;
+    freezing it makes that guarantee explicit so derived indexes and
+    memoized results built from it cannot silently go stale.  Month lists
+    become frozensets so ``month in sp["peak_months"]`` is a hash probe,
+    and each also gets a 12-bit ``peak_mask``/``good_mask`` (bit ``m - 1``
+    set for month ``m``) plus both combined into one 24-bit
+    ``season_mask`` (good months shifted up by 12) for single-AND tests
+    on the scoring hot path.
+    Short, heavily repeated text fields are interned so duplicates share
+    one object and compare by identity; equal month sets are pooled the
+    same way, so species with the same season share one frozenset.
+
+    Entries stay mappings rather than becoming a slotted dataclass or
+    NamedTuple: every consumer (rankings, calendar, rig and bait builders,
+    regulations, tests) reads them by key, and the scoring hot path reads
+    the packed columns below instead of entry fields.
+    """
+    month_sets: Dict[FrozenSet[int], FrozenSet[int]] = {}
+    frozen = []
+    for entry in entries:
+        entry = dict(entry)
+        for field in _INTERNED_FIELDS:
+            entry[field] = sys.intern(entry[field])
+        entry["peak_mask"] = month_mask(entry["peak_months"])
+        entry["good_mask"] = month_mask(entry["good_months"])
+        entry["season_mask"] = entry["peak_mask"] | entry["good_mask"] << GOOD_SHIFT
+        for field in ("peak_months", "good_months"):
+            months = frozenset(entry[field])
+            entry[field] = month_sets.setdefault(months, months)
+        frozen.append(MappingProxyType(entry))
+    return tuple(frozen)
+
+
+def _column(entries: Tuple[Mapping[str, Any], ...], field: str) -> array:
+    """Pack one numeric field of every entry into a contiguous array.
+
+    Double storage because the validator accepts non-integer temperatures
+    and scoring reads these columns directly, so values must round-trip
+    exactly.  Narrower int8 storage would not speed anything up either:
+    from Python every element read boxes a fresh number whatever the
+    typecode, and four double columns for a few hundred species are only
+    a few kilobytes.
+    """
+    return array("d", (entry[field] for entry in entries))
+
+
+def _enumerate(keys: Iterable[Hashable]) -> Tuple[Tuple[Any, ...], array]:
+    """Assign each distinct key a small integer id in first-seen order.
+
+    Returns the distinct keys plus one id per input pointing into them, so
+    grouping or filtering on a repeated value is an integer comparison
+    rather than a string match.
+    """
+    index: Dict[Hashable, int] = {}
+    ids = array("H")
+    for key in keys:
+        ids.append(index.setdefault(key, len(index)))
+    return tuple(index), ids
+
+
+def _is_protected(entry: Mapping[str, Any]) -> bool:
+    """True for species that must not be targeted (protected/endangered)."""
+    return (
+        "PROTECTED" in entry["bait"].upper()
+        or "ENDANGERED" in entry["explanation_warm"].upper()
+    )
+
+
 # Module-level singleton — loaded once at import time.
-SPECIES_DB: List[Dict[str, Any]] = load_species_db()
+SPECIES_DB: Tuple[Mapping[str, Any], ...] = _freeze(load_species_db())
+
+# Struct-of-arrays temperature columns, index-aligned with SPECIES_DB, so
+# whole-catalog range scans walk packed numbers instead of probing a
+# mapping per species.  They stay four separate columns rather than being
+# bit-packed into one word per species: temperatures may be fractional,
+# and in Python the shift/mask work to unpack a word costs more than the
+# extra column reads it would save.
+TEMP_MIN: array = _column(SPECIES_DB, "temp_min")
+TEMP_MAX: array = _column(SPECIES_DB, "temp_max")
+TEMP_IDEAL_LOW: array = _column(SPECIES_DB, "temp_ideal_low")
+TEMP_IDEAL_HIGH: array = _column(SPECIES_DB, "temp_ideal_high")
+
+# Coast as a small-int column alongside the temperatures; COAST_IDS[i]
+# indexes COASTS for SPECIES_DB[i].
+COASTS, COAST_IDS = _enumerate(entry["coast"] for entry in SPECIES_DB)
+COAST_INDEX: Dict[str, int] = {coast: i for i, coast in enumerate(COASTS)}
+
+
+def _temp_buckets(members: Iterable[int], exact: bool = False) -> Tuple[Tuple[int, ...], ...]:
+    """Bucket *members* by whole degree F.
+
+    Slot ``d - _TEMP_BASE`` holds the members whose survivable range
+    overlaps ``[d, d + 1)``, i.e. every species that can be present at any
+    temperature whose floor is ``d``; with *exact*, only those present at
+    ``d`` itself.  Each member is dropped into the slots its range spans,
+    so the build is linear in the index size rather than degrees x rows.
+    """
+    buckets: List[List[int]] = [[] for _ in range(_TEMP_BASE, math.floor(max(TEMP_MAX)) + 1)]
+    for i in members:
+        low = math.ceil(TEMP_MIN[i]) if exact else math.floor(TEMP_MIN[i])
+        for d in range(low, math.floor(TEMP_MAX[i]) + 1):
+            buckets[d - _TEMP_BASE].append(i)
+    return tuple(tuple(bucket) for bucket in buckets)
+
+
+# Inverted temperature index: coast (None for all coasts) -> per-degree
+# buckets of SPECIES_DB indices, so a range query reads one short bucket
+# instead of scanning every row.
+_TEMP_BASE: int = math.floor(min(TEMP_MIN))
+_COAST_MEMBERS: Dict[Optional[str], Tuple[int, ...]] = {None: tuple(range(len(SPECIES_DB)))}
+for _coast_id, _coast in enumerate(COASTS):
+    _COAST_MEMBERS[_coast] = tuple(i for i, c in enumerate(COAST_IDS) if c == _coast_id)
+_TEMP_BUCKETS: Dict[Optional[str], Tuple[Tuple[int, ...], ...]] = {
+    coast: _temp_buckets(members) for coast, members in _COAST_MEMBERS.items()
+}
+
+# The answer itself for whole-degree temperatures (monthly averages, and
+# live readings that land on a degree): slot ``d - _TEMP_BASE`` keeps only
+# the bucket members present at exactly ``d``, so those queries are a
+# single index with no per-candidate check.
+_TEMP_EXACT: Dict[Optional[str], Tuple[Tuple[int, ...], ...]] = {
+    coast: _temp_buckets(members, exact=True) for coast, members in _COAST_MEMBERS.items()
+}
+
+
+def indices_in_temp_range(water_temp: float, coast: Optional[str] = None) -> List[int]:
+    """Return SPECIES_DB indices whose survivable range includes *water_temp*.
+
+    Looks up the whole-degree bucket for *water_temp* (restricted to
+    *coast* when given) and checks only those candidates against the
+    packed TEMP_MIN/TEMP_MAX columns, so callers touch the full entry
+    mappings just for species that can actually be present.  Whole-degree
+    temperatures skip the check and copy the precomputed answer.
+    """
+    buckets = _TEMP_BUCKETS.get(coast)
+    if buckets is None or not (_TEMP_BASE <= water_temp < _TEMP_BASE + len(buckets)):
+        return []
+    d = math.floor(water_temp)
+    if d == water_temp:
+        return list(_TEMP_EXACT[coast][d - _TEMP_BASE])
+    return [
+        i for i in buckets[d - _TEMP_BASE]
+        if TEMP_MIN[i] <= water_temp <= TEMP_MAX[i]
+    ]
+
+
+# Name -> SPECIES_DB index.  A handful of names appear on more than one
+# coast; like any dict built from the catalog, the later entry wins.
+SPECIES_BY_NAME: Dict[str, int] = {entry["name"]: i for i, entry in enumerate(SPECIES_DB)}
+
+
+# Distinct rig descriptions in catalog order; domain/species.py classifies
+# each once at import into its rig categories.
+RIGS: Tuple[str, ...] = tuple(dict.fromkeys(entry["rig"] for entry in SPECIES_DB))
+
+# Peak and good months packed into one word per species, so season scoring
+# reads a single column.
+SEASON_MASKS: array = array("L", (entry["season_mask"] for entry in SPECIES_DB))
+
+
+# 1 where SPECIES_DB[i] is a no-target species, computed once so ranking
+# never has to string-scan the bait/explanation text per request.
+PROTECTED_MASK: array = array("b", (_is_protected(entry) for entry in SPECIES_DB))
@@ -514,7 +514,7 @@ def save_forecast_to_db(location_id: str, data: Dict[str, Any]) -> None:
     conn = get_db()
     conn.execute(
         "INSERT INTO forecasts (location_id, forecast_json, generated_at) VALUES (?, ?, ?)",
-        (location_id, json.dumps(data), generated_at),
+        (location_id, json.dumps(data, separators=(",", ":")), generated_at),
     )
     conn.commit()
     conn.close()
@@ -535,7 +535,7 @@ def save_forecast_cache(user_id: int, location_id: str, data: Dict[str, Any]) ->
             generated_at = excluded.generated_at,
             updated_at = datetime('now')
         """,
-        (user_id, location_id, json.dumps(data), generated_at),
+        (user_id, location_id, json.dumps(data, separators=(",", ":")), generated_at),
     )
     conn.commit()
     conn.close()
@@ -558,6 +558,19 @@ def load_forecast_cache(user_id: int, location_id: str) -> Optional[Dict[str, An
         return None
 
 
+def load_forecast_cache_stamp(user_id: int, location_id: str) -> Optional[str]:
+    """Return the cached row's ``generated_at`` without reading the document."""
+    if not location_id:
+        return None
+    conn = get_db()
+    row = conn.execute(
+        "SELECT generated_at FROM forecast_cache WHERE user_id = ? AND location_id = ?",
+        (user_id, location_id),
+    ).fetchone()
+    conn.close()
+    return row["generated_at"] if row else None
+
+
 def delete_forecast_cache(user_id: int, location_id: str) -> bool:
     conn = get_db()
     cur = conn.execute(
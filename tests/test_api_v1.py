@@ -30,7 +30,8 @@ def _login_session(client, user_id, location_id="wrightsville-beach-nc"):
 def test_v1_forecast_envelope(client, monkeypatch):
     sample = {"generated_at": "2026-03-03T10:00:00", "conditions": {"verdict": "Good"}}
 
-    monkeypatch.setattr("web.api.load_cached_forecast", lambda loc_id, user_id=None: sample)
+    monkeypatch.setattr("web.api.load_cached_forecast", lambda loc_id, user_id=None, include_stale=False: sample)
+    monkeypatch.setattr("web.api.enqueue_forecast_refresh", lambda loc_id, user_id=None: True)
 
     resp = client.get("/api/v1/forecast?location_id=wrightsville-beach-nc")
     assert resp.status_code == 200
@@ -383,3 +384,85 @@ def test_v1_forecast_section_endpoints_fall_back_to_shared_cache_for_logged_in_u
 
     assert ("wrightsville-beach-nc", 999) in calls
     assert ("wrightsville-beach-nc", None) in calls
+
+
+def test_legacy_forecast_body_follows_generated_at(client, monkeypatch):
+    cached = {"generated_at": "2026-03-04T08:00:00", "conditions": {"verdict": "Fair"}}
+    monkeypatch.setattr("web.api.load_cached_forecast", lambda loc_id, user_id=None, include_stale=False: cached)
+    monkeypatch.setattr("web.api.enqueue_forecast_refresh", lambda loc_id, user_id=None: True)
+
+    first = client.get("/api/forecast?location_id=wrightsville-beach-nc")
+    again = client.get("/api/forecast?location_id=wrightsville-beach-nc")
+    assert first.data == again.data
+    assert again.get_json()["conditions"]["verdict"] == "Fair"
+
+    cached = {"generated_at": "2026-03-04T12:00:00", "conditions": {"verdict": "Good"}}
+    resp = client.get("/api/forecast?location_id=wrightsville-beach-nc")
+    assert resp.get_json()["conditions"]["verdict"] == "Good"
+
+
+def test_legacy_forecast_answers_matching_etag_with_304(client, monkeypatch):
+    cached = {"generated_at": "2026-03-05T08:00:00", "conditions": {"verdict": "Fair"}}
+    monkeypatch.setattr("web.api.load_cached_forecast", lambda loc_id, user_id=None, include_stale=False: cached)
+    monkeypatch.setattr("web.api.enqueue_forecast_refresh", lambda loc_id, user_id=None: True)
+
+    first = client.get("/api/forecast?location_id=wrightsville-beach-nc")
+    etag = first.headers["ETag"]
+    assert "no-cache" in first.headers["Cache-Control"]
+
+    resp = client.get("/api/forecast?location_id=wrightsville-beach-nc", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.data == b""
+
+
+def test_v1_forecast_serves_stale_cache_and_queues_refresh(client, monkeypatch):
+    stale = {"generated_at": "2020-01-01T08:00:00-05:00", "conditions": {"verdict": "Poor"}}
+    monkeypatch.setattr("web.api.load_cached_forecast", lambda loc_id, user_id=None, include_stale=False: stale)
+    monkeypatch.setattr("web.api.generate_forecast", lambda location: pytest.fail("served request regenerated inline"))
+    queued = []
+    monkeypatch.setattr(
+        "web.api.enqueue_forecast_refresh",
+        lambda loc_id, user_id=None: queued.append(loc_id) or True,
+    )
+
+    resp = client.get("/api/v1/forecast?location_id=wrightsville-beach-nc")
+    assert resp.status_code == 200
+    assert resp.get_json()["data"]["forecast"]["conditions"]["verdict"] == "Poor"
+    assert queued == ["wrightsville-beach-nc"]
+
+
+def test_legacy_forecast_sends_last_modified_from_generated_at(client, monkeypatch):
+    cached = {"generated_at": "2026-03-06T08:00:00+00:00", "conditions": {"verdict": "Fair"}}
+    monkeypatch.setattr("web.api.load_cached_forecast", lambda loc_id, user_id=None, include_stale=False: cached)
+    monkeypatch.setattr("web.api.enqueue_forecast_refresh", lambda loc_id, user_id=None: True)
+
+    first = client.get("/api/forecast?location_id=wrightsville-beach-nc")
+    assert first.headers["Last-Modified"] == "Fri, 06 Mar 2026 08:00:00 GMT"
+
+    resp = client.get(
+        "/api/forecast?location_id=wrightsville-beach-nc",
+        headers={"If-Modified-Since": first.headers["Last-Modified"]},
+    )
+    assert resp.status_code == 304
+
+
+def test_v1_forecast_reuses_envelope_body_and_answers_304(client, monkeypatch):
+    cached = {"generated_at": "2026-03-07T08:00:00", "conditions": {"verdict": "Fair"}}
+    monkeypatch.setattr("web.api.load_cached_forecast", lambda loc_id, user_id=None, include_stale=False: cached)
+    monkeypatch.setattr("web.api.enqueue_forecast_refresh", lambda loc_id, user_id=None: True)
+
+    legacy = client.get("/api/forecast?location_id=wrightsville-beach-nc")
+    first = client.get("/api/v1/forecast?location_id=wrightsville-beach-nc")
+    again = client.get("/api/v1/forecast?location_id=wrightsville-beach-nc")
+
+    assert legacy.get_json()["conditions"]["verdict"] == "Fair"
+    assert first.get_json()["ok"] is True
+    assert first.get_json()["data"]["forecast"]["conditions"]["verdict"] == "Fair"
+    assert again.data == first.data
+    assert first.headers["ETag"] != legacy.headers["ETag"]
+
+    resp = client.get(
+        "/api/v1/forecast?location_id=wrightsville-beach-nc",
+        headers={"If-None-Match": first.headers["ETag"]},
+    )
+    assert resp.status_code == 304
@@ -116,3 +116,47 @@ def test_live_cams_have_dedicated_template():
     template = Path("templates/live_cams.html").read_text(encoding="utf-8")
     assert "Open live cam" in template
     assert "live-cam-status" in template
+
+
+def test_dashboard_keeps_each_sessions_csrf_token(app):
+    from tests.conftest import csrf_token_from_html
+
+    tokens = []
+    for client in (app.test_client(), app.test_client()):
+        resp = client.get("/f/dauphin-island-al")
+        assert resp.status_code == 200
+        with client.session_transaction() as sess:
+            assert csrf_token_from_html(resp.data) == sess["csrf_token"]
+        tokens.append(sess["csrf_token"])
+
+    assert tokens[0] != tokens[1]
+
+
+def test_dashboard_answers_matching_etag_with_304(client, monkeypatch):
+    from datetime import datetime
+    from zoneinfo import ZoneInfo
+
+    import web.views as views
+    from tests.conftest import set_session
+
+    stamp = datetime.now(ZoneInfo("America/New_York")).isoformat()
+    monkeypatch.setattr(views, "watch_forecast", lambda loc_id, user_id=None: None)
+    monkeypatch.setattr(
+        views, "load_cached_forecast",
+        lambda loc_id, user_id=None, include_stale=False: {"generated_at": stamp},
+    )
+    monkeypatch.setattr(views, "recompute_current_uv", lambda location: {"index": 3})
+    monkeypatch.setattr(views, "_build_live_cam_context", lambda location, profile: {})
+    monkeypatch.setattr(views, "render_template", lambda template, **context: "<html>dashboard</html>")
+    set_session(client, location_id="dauphin-island-al")
+
+    first = client.get("/")
+    etag = first.headers["ETag"]
+    assert "no-cache" in first.headers["Cache-Control"]
+
+    resp = client.get("/", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.data == b""
+
+    personalized = client.get("/?targets=redfish", headers={"If-None-Match": etag})
+    assert personalized.status_code == 200
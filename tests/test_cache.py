@@ -10,9 +10,12 @@ from zoneinfo import ZoneInfo
 
 from storage.cache import (
     CACHE_MAX_AGE_HOURS,
+    CACHE_MAX_AGE_JITTER,
     _cache_path,
     _forecast_age_minutes,
     _human_age,
+    _max_age_minutes,
+    expires_within,
     load_cached_forecast,
     save_forecast,
 )
@@ -57,6 +60,32 @@ class TestSaveAndLoad:
         loaded = load_cached_forecast("")
         assert loaded == data
 
+    def test_json_save_leaves_no_temp_file(self, isolated_storage):
+        save_forecast({"generated_at": "2026-03-01T12:00:00"}, "")
+        assert sorted(os.listdir(isolated_storage)) == ["forecast.json", "test.db"]
+
+    def test_truncated_json_is_a_miss(self, isolated_storage):
+        (isolated_storage / "forecast.json").write_text('{"generated_at": "2026-', encoding="utf-8")
+        assert load_cached_forecast("") is None
+
+    def test_repeat_loads_return_independent_copies(self):
+        now = datetime.now(ZoneInfo("America/New_York")).isoformat()
+        save_forecast({"generated_at": now, "outlook": [{"wind": "5 kt"}]}, "copy-loc")
+        first = load_cached_forecast("copy-loc")
+        first["outlook"][0]["wind"] = "6 mph"
+        assert load_cached_forecast("copy-loc")["outlook"][0]["wind"] == "5 kt"
+
+    def test_row_rewritten_elsewhere_is_reloaded(self):
+        from storage.sqlite import save_forecast_cache
+
+        now = datetime.now(ZoneInfo("America/New_York"))
+        save_forecast({"generated_at": now.isoformat(), "verdict": "Fair"}, "shared-loc")
+        assert load_cached_forecast("shared-loc")["verdict"] == "Fair"
+        # Another worker process saves straight to the table.
+        later = (now + timedelta(minutes=1)).isoformat()
+        save_forecast_cache(0, "shared-loc", {"generated_at": later, "verdict": "Good"})
+        assert load_cached_forecast("shared-loc")["verdict"] == "Good"
+
     def test_load_missing_returns_none(self):
         assert load_cached_forecast("nonexistent") is None
 
@@ -128,6 +157,31 @@ class TestForecastAge:
         assert _forecast_age_minutes({"generated_at": "not-a-date"}) is None
 
 
+class TestMaxAge:
+    def test_expiry_is_spread_around_the_base_ttl(self):
+        base = CACHE_MAX_AGE_HOURS * 60
+        limits = {
+            _max_age_minutes({"generated_at": f"2026-03-01T{h:02d}:{m:02d}:00-05:00"})
+            for h in range(24) for m in range(0, 60, 7)
+        }
+        assert len(limits) > 1
+        assert all(base * (1 - CACHE_MAX_AGE_JITTER) <= v <= base * (1 + CACHE_MAX_AGE_JITTER) for v in limits)
+
+    def test_expiry_is_stable_per_forecast(self):
+        forecast = {"generated_at": "2026-03-01T12:00:00-05:00"}
+        assert _max_age_minutes(forecast) == _max_age_minutes(dict(forecast))
+
+    def test_missing_stamp_uses_base_ttl(self):
+        assert _max_age_minutes({}) == CACHE_MAX_AGE_HOURS * 60
+
+    def test_expires_within_looks_ahead(self):
+        forecast = {"generated_at": datetime.now(ZoneInfo("America/New_York")).isoformat()}
+        limit = _max_age_minutes(forecast)
+        assert not expires_within(forecast, limit - 5)
+        assert expires_within(forecast, limit + 5)
+        assert expires_within({}, 0)
+
+
 class TestHumanAge:
     def test_none_returns_empty(self):
         assert _human_age(None) == ""
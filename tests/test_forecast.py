@@ -606,3 +606,183 @@ def test_tide_predictions_fall_back_to_available_date_when_today_missing(monkeyp
     assert out["tides"][0]["date_str"] == "20260103"
     assert isinstance(out["tide_chart"], dict)
     assert "path" in out["tide_chart"]
+
+
+def test_concurrent_generate_forecast_calls_share_one_build(monkeypatch):
+    import threading
+    import time
+
+    import domain.forecast as fc
+
+    release = threading.Event()
+    builds = []
+
+    def _slow_build(location, profile):
+        builds.append(location["id"])
+        release.wait(timeout=5)
+        return {"location_id": location["id"], "species": ["Spot"]}
+
+    monkeypatch.setattr(fc, "_build_forecast", _slow_build)
+
+    started = threading.Barrier(5)
+    results = []
+
+    def _request():
+        started.wait(timeout=5)
+        results.append(fc.generate_forecast({"id": "test-loc"}))
+
+    workers = [threading.Thread(target=_request) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    started.wait(timeout=5)
+    time.sleep(0.1)  # let every caller reach the in-flight check
+    release.set()
+    for worker in workers:
+        worker.join(timeout=5)
+
+    assert builds == ["test-loc"]
+    assert len(results) == 4
+    assert all(r == {"location_id": "test-loc", "species": ["Spot"]} for r in results)
+    assert len({id(r) for r in results}) == 4
+
+
+def test_coalesced_caller_gives_up_on_a_slow_build(monkeypatch):
+    import threading
+
+    import domain.forecast as fc
+
+    entered = threading.Event()
+    release = threading.Event()
+
+    def _slow_build(location, profile):
+        entered.set()
+        release.wait(timeout=5)
+        return {"location_id": location["id"]}
+
+    monkeypatch.setattr(fc, "_build_forecast", _slow_build)
+    monkeypatch.setattr(fc, "COALESCE_WAIT_SECONDS", 0.05)
+
+    leader = threading.Thread(target=fc.generate_forecast, args=({"id": "test-loc"},))
+    leader.start()
+    assert entered.wait(timeout=5)
+    try:
+        with pytest.raises(TimeoutError):
+            fc.generate_forecast({"id": "test-loc"})
+    finally:
+        release.set()
+        leader.join(timeout=5)
+    assert fc._inflight == {}
+    assert fc._inflight_waiters == {}
+
+
+def test_uncontended_build_is_not_snapshotted(monkeypatch):
+    import domain.forecast as fc
+
+    built = {"location_id": "test-loc"}
+    monkeypatch.setattr(fc, "_build_forecast", lambda location, profile: built)
+
+    def _no_copy(value):
+        raise AssertionError("nobody was waiting for this build")
+
+    monkeypatch.setattr(fc.copy, "deepcopy", _no_copy)
+    assert fc.generate_forecast({"id": "test-loc"}) is built
+
+
+def test_format_clock_time_is_unpadded_twelve_hour():
+    from services.astro import format_clock_time
+
+    assert format_clock_time(datetime(2026, 1, 1, 0, 5)) == "12:05 AM"
+    assert format_clock_time(datetime(2026, 1, 1, 6, 30)) == "6:30 AM"
+    assert format_clock_time(datetime(2026, 1, 1, 12, 0)) == "12:00 PM"
+    assert format_clock_time(datetime(2026, 1, 1, 19, 45)) == "7:45 PM"
+
+
+def test_generate_forecast_fetches_upstream_sources_concurrently(monkeypatch):
+    """Independent upstream fetches should overlap rather than run back to back."""
+    import threading
+
+    from domain import forecast as fc
+
+    # Deadlocks (and times out) unless marine conditions and water
+    # temperature are in flight at the same time.
+    both_fetching = threading.Barrier(2, timeout=5)
+
+    def _marine(*_args, **_kwargs):
+        both_fetching.wait()
+        return (5.0, 8.0), (1.0, 2.0), "NW"
+
+    def _water_temp(*_args, **_kwargs):
+        both_fetching.wait()
+        return 70.0, True
+
+    monkeypatch.setattr(fc, "get_marine_conditions", _marine)
+    monkeypatch.setattr(fc, "get_water_temp", _water_temp)
+    for name in (
+        "fetch_tide_predictions",
+        "fetch_barometric_pressure",
+        "fetch_weather_alerts",
+        "fetch_state_alerts",
+        "fetch_current_weather",
+        "fetch_coops_environmental_metrics",
+        "fetch_currents_predictions",
+        "fetch_currents_observation",
+    ):
+        monkeypatch.setattr(fc, name, lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(fc, "build_multiday_outlook", lambda *_args, **_kwargs: [])
+
+    out = fc.generate_forecast({"id": "test-loc", "name": "Test", "state": "NC"})
+
+    assert out["conditions"]["wind"] == "NW 5-8 kt"
+    assert out["conditions"]["water_temp_f"] == 70.0
+
+
+def test_simultaneous_builds_do_not_queue_on_the_shared_pool(monkeypatch):
+    """Each build holds one fetch worker, so two builds overlap on a 2-worker pool."""
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    from domain import forecast as fc
+
+    # Deadlocks (and times out) unless both builds have marine conditions
+    # and water temperature in flight at once.
+    all_fetching = threading.Barrier(4, timeout=5)
+
+    def _marine(*_args, **_kwargs):
+        all_fetching.wait()
+        return (5.0, 8.0), (1.0, 2.0), "NW"
+
+    def _water_temp(*_args, **_kwargs):
+        all_fetching.wait()
+        return 70.0, True
+
+    pool = ThreadPoolExecutor(max_workers=2)
+    monkeypatch.setattr(fc, "_upstream_pool", pool)
+    monkeypatch.setattr(fc, "get_marine_conditions", _marine)
+    monkeypatch.setattr(fc, "get_water_temp", _water_temp)
+    for name in (
+        "fetch_tide_predictions",
+        "fetch_barometric_pressure",
+        "fetch_weather_alerts",
+        "fetch_state_alerts",
+        "fetch_current_weather",
+        "fetch_coops_environmental_metrics",
+        "fetch_currents_predictions",
+        "fetch_currents_observation",
+    ):
+        monkeypatch.setattr(fc, name, lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(fc, "build_multiday_outlook", lambda *_args, **_kwargs: [])
+
+    results = {}
+
+    def _build(loc_id):
+        results[loc_id] = fc.generate_forecast({"id": loc_id, "name": "Test", "state": "NC"})
+
+    builds = [threading.Thread(target=_build, args=(loc_id,)) for loc_id in ("loc-a", "loc-b")]
+    for build in builds:
+        build.start()
+    for build in builds:
+        build.join(timeout=10)
+    pool.shutdown(wait=False)
+
+    assert sorted(results) == ["loc-a", "loc-b"]
+    assert all(out["conditions"]["water_temp_f"] == 70.0 for out in results.values())
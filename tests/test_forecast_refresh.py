@@ -0,0 +1,63 @@
+"""Tests for the background forecast refresh sweeper."""
+
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+import services.forecast_refresh as fr
+from storage.cache import CACHE_MAX_AGE_HOURS, CACHE_MAX_AGE_JITTER, save_forecast
+
+_EASTERN = ZoneInfo("America/New_York")
+
+
+@pytest.fixture(autouse=True)
+def isolated_refresh(tmp_path, monkeypatch):
+    """Temp DB, no real threads, and a recorder in place of the queue."""
+    monkeypatch.setattr("storage.cache.CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr("storage.sqlite.DB_PATH", str(tmp_path / "test.db"))
+    from storage.sqlite import init_db
+    init_db()
+
+    queued = []
+    monkeypatch.setattr(fr, "_watched", {})
+    monkeypatch.setattr(fr, "_ensure_sweeper_started", lambda: None)
+    monkeypatch.setattr(
+        fr, "enqueue_forecast_refresh",
+        lambda loc_id, user_id=None: queued.append((loc_id, user_id)) or True,
+    )
+    return queued
+
+
+def _save_aged(location_id, minutes):
+    stamp = (datetime.now(_EASTERN) - timedelta(minutes=minutes)).isoformat()
+    save_forecast({"generated_at": stamp}, location_id)
+
+
+def test_fresh_forecast_is_left_alone(isolated_refresh):
+    _save_aged("test-loc", 5)
+    fr.watch_forecast("test-loc")
+    assert fr._sweep_once() == 0
+    assert isolated_refresh == []
+
+
+def test_forecast_expiring_before_next_sweep_is_queued(isolated_refresh):
+    # Just under the latest possible (jittered) expiry.
+    _save_aged("test-loc", CACHE_MAX_AGE_HOURS * 60 * (1 + CACHE_MAX_AGE_JITTER) - 1)
+    fr.watch_forecast("test-loc")
+    assert fr._sweep_once() == 1
+    assert isolated_refresh == [("test-loc", None)]
+
+
+def test_watched_location_without_cache_row_is_queued(isolated_refresh):
+    fr.watch_forecast("test-loc", user_id=7)
+    fr._sweep_once()
+    assert isolated_refresh == [("test-loc", 7)]
+
+
+def test_unviewed_location_drops_off_the_watch_list(isolated_refresh):
+    fr.watch_forecast("test-loc")
+    later = fr._watched[("test-loc", 0)] + fr.WATCH_TTL_HOURS * 3600 + 1
+    assert fr._sweep_once(now=later) == 0
+    assert fr._watched == {}
+    assert isolated_refresh == []
@@ -0,0 +1,83 @@
+"""Tests for services.http_client."""
+
+import requests
+
+import services.http_client as http_client
+
+
+def _response(status, body=b"", headers=None):
+    resp = requests.Response()
+    resp.status_code = status
+    resp._content = body
+    resp.headers.update(headers or {})
+    return resp
+
+
+def test_not_modified_returns_previous_response(monkeypatch):
+    monkeypatch.setattr(http_client, "_validated_responses", {})
+    sent = []
+    replies = [
+        _response(200, b'{"v": 1}', {"ETag": '"abc"', "Last-Modified": "Fri, 06 Mar 2026 08:00:00 GMT"}),
+        _response(304),
+    ]
+
+    def _fake_get(url, headers=None, timeout=None):
+        sent.append(dict(headers or {}))
+        return replies.pop(0)
+
+    monkeypatch.setattr(http_client._session, "get", _fake_get)
+
+    first = http_client.get("https://example.test/doc", endpoint="test.doc", headers={"User-Agent": "t"})
+    second = http_client.get("https://example.test/doc", endpoint="test.doc", headers={"User-Agent": "t"})
+
+    assert "If-None-Match" not in sent[0]
+    assert sent[1]["If-None-Match"] == '"abc"'
+    assert sent[1]["If-Modified-Since"] == "Fri, 06 Mar 2026 08:00:00 GMT"
+    assert sent[1]["User-Agent"] == "t"
+    assert second is first
+    assert second.json() == {"v": 1}
+
+
+def test_responses_without_validators_are_not_kept(monkeypatch):
+    monkeypatch.setattr(http_client, "_validated_responses", {})
+    monkeypatch.setattr(http_client._session, "get", lambda url, headers=None, timeout=None: _response(200, b"x"))
+
+    http_client.get("https://example.test/plain", endpoint="test.plain")
+
+    assert http_client._validated_responses == {}
+
+
+def test_not_modified_uses_response_the_validators_came_from(monkeypatch):
+    stored = _response(200, b'{"v": 1}', {"ETag": '"abc"'})
+    store = {"https://example.test/doc": stored}
+    monkeypatch.setattr(http_client, "_validated_responses", store)
+
+    def _fake_get(url, headers=None, timeout=None):
+        store.clear()  # another thread evicts the entry mid-request
+        return _response(304)
+
+    monkeypatch.setattr(http_client._session, "get", _fake_get)
+
+    assert http_client.get("https://example.test/doc", endpoint="test.doc") is stored
+
+
+def test_full_store_evicts_least_recently_used_entry(monkeypatch):
+    monkeypatch.setattr(http_client, "_validated_responses", {})
+    monkeypatch.setattr(http_client, "_MAX_VALIDATED_RESPONSES", 2)
+    for url in ("https://example.test/a", "https://example.test/b"):
+        http_client._remember(url, _response(200, b"x", {"ETag": '"1"'}))
+    http_client._conditional_headers("https://example.test/a", None)  # touch a
+
+    http_client._remember("https://example.test/c", _response(200, b"x", {"ETag": '"1"'}))
+
+    assert list(http_client._validated_responses) == ["https://example.test/a", "https://example.test/c"]
+
+
+def test_forked_child_gets_its_own_session(monkeypatch):
+    parent = http_client._session
+    monkeypatch.setattr(http_client, "_session", parent)  # restored after the test
+
+    http_client._reset_session()
+
+    assert http_client._session is not parent
+    assert http_client._session.get_adapter("https://api.weather.gov") is not parent.get_adapter("https://api.weather.gov")
@@ -1,18 +1,26 @@
 """Tests for domain.species scoring and ranking."""
 
+import json
+import pathlib
+from collections.abc import Mapping
+
 import pytest
 
 from domain.species import (
     BAIT_DB,
+    NATURAL_BAIT_DB,
+    RIG_CATEGORIES,
     SPECIES_DB,
     _regulation_disallows_keep,
     _score_species,
     _species_matches_profile,
     build_bait_ranking,
     build_natural_bait_chart,
+    build_rig_recommendations,
     build_species_calendar,
     build_species_ranking,
 )
+from storage.species_loader import _is_mojibake
 
 
 # Grab a known species entry for testing
@@ -241,6 +249,43 @@ class TestPersonalizationHardGate:
         assert "Speckled trout (spotted seatrout)" not in names, "Inshore-only species should be absent for offshore angler"
 
 
+class TestProtectedSpecies:
+    def test_ranking_excludes_protected_species(self):
+        turtle = _get_species("Kemp's ridley")
+        # Would comfortably clear the threshold on temperature/season alone
+        assert _score_species(turtle, month=7, water_temp=76) >= 65
+
+        names = {sp["name"] for sp in build_species_ranking(month=7, water_temp=76, coast="east")}
+        assert "Kemp's ridley sea turtle" not in names
+        assert "Atlantic sturgeon" not in names
+
+
+class TestRankingMemoization:
+    def test_repeat_calls_return_fresh_entries(self):
+        kwargs = dict(month=7, water_temp=76, wind_range=[5, 12], fishing_types=["surf", "pier"])
+        first = build_species_ranking(**kwargs)
+        first[0]["tip"] = "mutated by caller"
+        second = build_species_ranking(**kwargs)
+        assert [sp["name"] for sp in second] == [sp["name"] for sp in first]
+        assert "tip" not in second[0]
+
+    def test_repeat_rig_recommendations_return_fresh_targets(self):
+        ranking = build_species_ranking(month=7, water_temp=76)
+        first = build_rig_recommendations(ranking)
+        first[0]["targets"].append("mutated by caller")
+        second = build_rig_recommendations(ranking)
+        assert "mutated by caller" not in second[0]["targets"]
+        assert [r["name"] for r in second] == [r["name"] for r in first]
+
+    def test_repeat_bait_rankings_return_fresh_entries(self):
+        ranking = build_species_ranking(month=7, water_temp=76)
+        first = build_bait_ranking(ranking, 7)
+        first[0]["notes"] = "mutated by caller"
+        second = build_bait_ranking(ranking, 7)
+        assert second[0]["notes"] != "mutated by caller"
+        assert [b["bait"] for b in second] == [b["bait"] for b in first]
+
+
 class TestRegulationHarvestFilter:
     def test_regulation_disallow_parser(self):
         assert _regulation_disallows_keep({"bag_limit": "0/day"}) is True
@@ -274,3 +319,29 @@ class TestRegulationHarvestFilter:
 
         assert "Sheepshead" not in names
         assert [sp["rank"] for sp in ranking] == list(range(1, len(ranking) + 1))
+
+
+def _strings(value):
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, Mapping):
+        for v in value.values():
+            yield from _strings(v)
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            yield from _strings(v)
+
+
+class TestTextEncoding:
+    """Display text must be stored correctly encoded, not fixed up per request."""
+
+    @pytest.mark.parametrize("table", [BAIT_DB, NATURAL_BAIT_DB, RIG_CATEGORIES])
+    def test_domain_tables_have_no_mojibake(self, table):
+        bad = [text for text in _strings(table) if _is_mojibake(text)]
+        assert not bad
+
+    def test_regulations_snapshot_has_no_mojibake(self):
+        path = pathlib.Path(__file__).resolve().parent.parent / "storage" / "regulations_data.json"
+        data = json.loads(path.read_text(encoding="utf-8"))
+        bad = [text for text in _strings(data) if _is_mojibake(text)]
+        assert not bad
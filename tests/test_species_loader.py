@@ -8,10 +8,22 @@ import pathlib
 import pytest
 
 from storage.species_loader import (
+    GOOD_SHIFT,
+    PROTECTED_MASK,
+    RIGS,
+    SEASON_MASKS,
+    SPECIES_BY_NAME,
     SPECIES_DB,
+    TEMP_IDEAL_HIGH,
+    TEMP_IDEAL_LOW,
+    TEMP_MAX,
+    TEMP_MIN,
     _REQUIRED_FIELDS,
     _VALID_COASTS,
+    indices_in_temp_range,
+    load_seasonal_explanations,
     load_species_db,
+    month_mask,
 )
 
 
@@ -51,10 +63,14 @@ def _minimal_entry(**overrides) -> dict:
 
 class TestModuleLevelDB:
     def test_loaded_at_import(self):
-        """SPECIES_DB must be a non-empty list available at import time."""
-        assert isinstance(SPECIES_DB, list)
+        """SPECIES_DB must be a non-empty tuple available at import time."""
+        assert isinstance(SPECIES_DB, tuple)
         assert len(SPECIES_DB) > 0
 
+    def test_entries_are_read_only(self):
+        with pytest.raises(TypeError):
+            SPECIES_DB[0]["name"] = "Renamed"
+
     def test_count_matches_known_total(self):
         """Expect 307 entries — catches accidental data truncation."""
         assert len(SPECIES_DB) == 307
@@ -100,6 +116,83 @@ class TestModuleLevelDB:
                         f"'{sp['name']}' {field} contains bad month {m!r}"
                     )
 
+    def test_repeated_text_fields_share_one_object(self):
+        by_value = {}
+        for sp in SPECIES_DB:
+            for field in ("bait", "rig", "hook_size", "sinker", "coast"):
+                assert by_value.setdefault(sp[field], sp[field]) is sp[field]
+
+    def test_month_fields_are_frozensets(self):
+        for sp in SPECIES_DB:
+            assert isinstance(sp["peak_months"], frozenset)
+            assert isinstance(sp["good_months"], frozenset)
+
+    def test_equal_month_sets_share_one_object(self):
+        by_value = {}
+        for sp in SPECIES_DB:
+            for field in ("peak_months", "good_months"):
+                assert by_value.setdefault(sp[field], sp[field]) is sp[field]
+
+    def test_month_masks_match_month_sets(self):
+        for sp in SPECIES_DB:
+            assert sp["peak_mask"] == month_mask(sp["peak_months"])
+            assert sp["good_mask"] == month_mask(sp["good_months"])
+            for m in range(1, 13):
+                assert bool(sp["peak_mask"] & (1 << (m - 1))) == (m in sp["peak_months"])
+
+    def test_season_mask_packs_peak_and_good(self):
+        for sp, season in zip(SPECIES_DB, SEASON_MASKS):
+            assert season == sp["season_mask"]
+            assert season == sp["peak_mask"] | sp["good_mask"] << GOOD_SHIFT
+
+    def test_temperature_columns_align_with_entries(self):
+        columns = {
+            "temp_min": TEMP_MIN,
+            "temp_max": TEMP_MAX,
+            "temp_ideal_low": TEMP_IDEAL_LOW,
+            "temp_ideal_high": TEMP_IDEAL_HIGH,
+        }
+        for field, column in columns.items():
+            assert len(column) == len(SPECIES_DB)
+            assert list(column) == [sp[field] for sp in SPECIES_DB]
+
+    def test_rigs_are_the_distinct_entry_rigs(self):
+        assert len(set(RIGS)) == len(RIGS)
+        assert set(RIGS) == {sp["rig"] for sp in SPECIES_DB}
+
+    def test_protected_mask_flags_no_target_species(self):
+        protected = {sp["name"] for sp, flag in zip(SPECIES_DB, PROTECTED_MASK) if flag}
+        assert "Atlantic sturgeon" in protected
+        assert "Kemp's ridley sea turtle" in protected
+        assert "Red drum (puppy drum)" not in protected
+
+    def test_indices_in_temp_range_matches_entry_bounds(self):
+        for t in (30, 45, 62.5, 80, 95):
+            expected = [
+                i for i, sp in enumerate(SPECIES_DB)
+                if sp["temp_min"] <= t <= sp["temp_max"]
+            ]
+            assert indices_in_temp_range(t) == expected
+
+    def test_indices_in_temp_range_filters_by_coast(self):
+        for coast in ("east", "west", "hawaii"):
+            expected = [
+                i for i, sp in enumerate(SPECIES_DB)
+                if sp["coast"] == coast and sp["temp_min"] <= 76 <= sp["temp_max"]
+            ]
+            assert expected
+            assert indices_in_temp_range(76, coast) == expected
+        assert indices_in_temp_range(76, "gulf") == []
+
+    def test_indices_in_temp_range_outside_catalog_bounds(self):
+        assert indices_in_temp_range(min(TEMP_MIN) - 0.5) == []
+        assert indices_in_temp_range(max(TEMP_MAX) + 0.5) == []
+        assert indices_in_temp_range(float("nan")) == []
+
+    def test_name_index_points_at_named_entry(self):
+        for name, i in SPECIES_BY_NAME.items():
+            assert SPECIES_DB[i]["name"] == name
+
     def test_first_entry_is_red_drum(self):
         """Ordering sanity: Red drum should be first (east coast, entry #1)."""
         assert SPECIES_DB[0]["name"].startswith("Red drum")
@@ -108,6 +201,13 @@ class TestModuleLevelDB:
         assert SPECIES_DB[-1]["coast"] == "hawaii"
 
 
+def test_month_mask_sets_one_bit_per_month():
+    assert month_mask([]) == 0
+    assert month_mask([1]) == 0b1
+    assert month_mask([1, 12]) == 0b1000_0000_0001
+    assert month_mask(range(1, 13)) == 0xFFF
+
+
 # ---------------------------------------------------------------------------
 # load_species_db() — happy path
 # ---------------------------------------------------------------------------
@@ -214,7 +314,57 @@ class TestLoadSpeciesDbErrors:
         with pytest.raises(ValueError, match="peak_months"):
             load_species_db(path=p)
 
+    def test_mojibake_text_raises(self, tmp_path):
+        bad = "PROTECTED SPECIES \u00e2\u20ac\u201d must be released if caught"
+        p = _write_json(tmp_path, [_minimal_entry(bait=bad)])
+        with pytest.raises(ValueError, match="double-encoded"):
+            load_species_db(path=p)
+
+    def test_proper_unicode_text_is_valid(self, tmp_path):
+        entry = _minimal_entry(bait="PROTECTED SPECIES \u2014 must be released; jalape\u00f1o")
+        p = _write_json(tmp_path, [entry])
+        assert load_species_db(path=p)[0]["bait"] == entry["bait"]
+
     def test_regions_not_list_raises(self, tmp_path):
         p = _write_json(tmp_path, [_minimal_entry(regions="northeast")])
         with pytest.raises(ValueError, match="regions"):
             load_species_db(path=p)
+
+
+# ---------------------------------------------------------------------------
+# load_seasonal_explanations
+# ---------------------------------------------------------------------------
+
+class TestLoadSeasonalExplanations:
+    def test_default_file_loads(self):
+        data = load_seasonal_explanations()
+        assert "Red drum (puppy drum)" in data
+        assert set(data["Red drum (puppy drum)"]) <= {"winter", "spring", "summer", "fall"}
+
+    def test_default_file_names_catalog_species(self):
+        data = load_seasonal_explanations(species_names=SPECIES_BY_NAME)
+        assert set(data) <= set(SPECIES_BY_NAME)
+
+    def test_unknown_species_raises(self, tmp_path):
+        p = _write_json(tmp_path, {"Red drumm": {"fall": "Running the beach."}})
+        with pytest.raises(ValueError, match="unknown species"):
+            load_seasonal_explanations(path=p, species_names=SPECIES_BY_NAME)
+
+    def test_unknown_season_raises(self, tmp_path):
+        p = _write_json(tmp_path, {"Red drum": {"autumn": "Running the beach."}})
+        with pytest.raises(ValueError, match="unknown season"):
+            load_seasonal_explanations(path=p)
+
+    def test_non_object_raises(self, tmp_path):
+        p = _write_json(tmp_path, [{"Red drum": {"fall": "Running the beach."}}])
+        with pytest.raises(ValueError, match="object"):
+            load_seasonal_explanations(path=p)
+
+    def test_empty_text_raises(self, tmp_path):
+        p = _write_json(tmp_path, {"Red drum": {"fall": "  "}})
+        with pytest.raises(ValueError, match="non-empty"):
+            load_seasonal_explanations(path=p)
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_seasonal_explanations(path=tmp_path / "missing.json")
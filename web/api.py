@@ -10,12 +10,19 @@ from typing import Any, Dict, Optional, Tuple
 logger = logging.getLogger(__name__)
 
 from flask import Blueprint, current_app, g, jsonify, redirect, request, session, url_for
+from werkzeug.http import generate_etag
 
 from domain.forecast import build_share_text, generate_forecast
-from services.forecast_refresh import enqueue_forecast_refresh, is_refreshing
+from services.forecast_refresh import enqueue_forecast_refresh, is_refreshing, watch_forecast
 from locations import get_location
 from regulations import lookup_regulation
-from storage.cache import CACHE_MAX_AGE_HOURS, _forecast_age_minutes, load_cached_forecast, save_forecast
+from storage.cache import (
+    _forecast_age_minutes,
+    _max_age_minutes,
+    _parse_generated_at,
+    load_cached_forecast,
+    save_forecast,
+)
 from storage.sqlite import (
     add_log_entry,
     attach_photos_to_entry,
@@ -26,7 +33,7 @@ from storage.sqlite import (
     get_preferences,
     save_preferences,
 )
-from web.helpers import get_session_location
+from web.helpers import conditional_response, get_session_location
 from web.openapi import build_openapi_spec
 from web.schemas import (
     ApiError,
@@ -46,6 +53,55 @@ def _json_error(err: ApiError) -> Any:
     return jsonify(error_envelope(err.code, err.message, details=err.details)), err.status
 
 
+# Serialized forecast bodies per (location, user, response shape).  A
+# cached forecast document only changes when it is regenerated, which
+# stamps a new ``generated_at``, so polling clients reuse one
+# serialization (and ETag) per forecast.
+_FORECAST_BODIES: Dict[Tuple[str, Optional[int], str], Tuple[str, bytes, str]] = {}
+_MAX_FORECAST_BODIES = 256
+
+
+def _forecast_json_response(
+    forecast_data: Dict[str, Any],
+    loc_id: str,
+    user_id: Optional[int],
+    v1_payload: Optional[Dict[str, Any]] = None,
+) -> Any:
+    """Return *forecast_data* as a conditional JSON response.
+
+    With *v1_payload* the body is that payload in the v1 success envelope
+    instead of the raw forecast document.  Reuses the body and ETag
+    serialized for the same forecast last time.
+    """
+    if v1_payload is None:
+        shape = "raw"
+    else:
+        shape = "v1-forced" if v1_payload.get("force_refresh") else "v1"
+    key = (loc_id, user_id, shape)
+    generated_at = forecast_data.get("generated_at")
+    cached = _FORECAST_BODIES.get(key)
+    if generated_at and cached is not None and cached[0] == generated_at:
+        _, body, etag = cached
+    else:
+        document = forecast_data if v1_payload is None else success_envelope(v1_payload)
+        body = current_app.json.response(document).get_data()
+        etag = generate_etag(body)
+        if generated_at:
+            if len(_FORECAST_BODIES) >= _MAX_FORECAST_BODIES:
+                _FORECAST_BODIES.clear()
+            _FORECAST_BODIES[key] = (generated_at, body, etag)
+
+    response = current_app.response_class(body, mimetype="application/json")
+    # The forecast document only changes when regenerated, so its stamp is
+    # a valid Last-Modified for If-Modified-Since revalidation.
+    if isinstance(generated_at, str):
+        try:
+            response.last_modified = _parse_generated_at(generated_at)
+        except ValueError:
+            pass
+    return conditional_response(response, etag)
+
+
 def _v1_forecast_payload(query: ForecastQuery) -> Dict[str, Any]:
     location = get_location(query.location_id) if query.location_id else get_session_location()
     if not location:
@@ -53,15 +109,23 @@ def _v1_forecast_payload(query: ForecastQuery) -> Dict[str, Any]:
 
     loc_id = location["id"]
     user_id = g.user["id"] if g.user else None
+    watch_forecast(loc_id, user_id=user_id)
     if query.force_refresh:
         logger.info("cache.force_refresh location_id=%s", loc_id)
         forecast_data = generate_forecast(location)
         save_forecast(forecast_data, loc_id, user_id=user_id)
         logger.info("cache.regenerated location_id=%s", loc_id)
     else:
-        forecast_data = load_cached_forecast(loc_id, user_id=user_id)
+        forecast_data = load_cached_forecast(loc_id, user_id=user_id, include_stale=True)
         if forecast_data:
-            logger.info("cache.hit location_id=%s", loc_id)
+            age = _forecast_age_minutes(forecast_data)
+            if age is not None and age > _max_age_minutes(forecast_data):
+                # Serve the stale copy now and regenerate in the background
+                # rather than holding the request on the upstream APIs.
+                logger.info("cache.stale_served location_id=%s", loc_id)
+                enqueue_forecast_refresh(loc_id, user_id=user_id)
+            else:
+                logger.info("cache.hit location_id=%s", loc_id)
         if not forecast_data:
             logger.info("cache.miss location_id=%s", loc_id)
             forecast_data = generate_forecast(location)
@@ -231,7 +295,8 @@ def forecast() -> Any:
         return jsonify({"error": err.message}), err.status
 
     # Keep legacy shape: return raw forecast document
-    return jsonify(payload["forecast"])
+    user_id = g.user["id"] if g.user else None
+    return _forecast_json_response(payload["forecast"], payload["location_id"], user_id)
 
 
 @bp.route("/api/v1/forecast", methods=["GET"])
@@ -245,7 +310,8 @@ def forecast_v1() -> Any:
     except ApiError as err:
         return _json_error(err)
 
-    return jsonify(success_envelope(payload))
+    user_id = g.user["id"] if g.user else None
+    return _forecast_json_response(payload["forecast"], payload["location_id"], user_id, v1_payload=payload)
 
 
 
@@ -262,7 +328,7 @@ def forecast_status_v1(location_id: str) -> Any:
         }))
 
     age = _forecast_age_minutes(forecast_data)
-    is_stale = bool(age is not None and age > CACHE_MAX_AGE_HOURS * 60)
+    is_stale = bool(age is not None and age > _max_age_minutes(forecast_data))
     return jsonify(success_envelope({
         "location_id": location_id,
         "last_generated_at": forecast_data.get("generated_at"),
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import secrets
 from typing import Any, Dict, Optional
 
-from flask import g, session
+from flask import Response, g, request, session
 
 from locations import get_location
 from storage.sqlite import get_preferences
@@ -25,3 +26,28 @@ def get_session_location() -> Optional[Dict[str, Any]]:
     if loc_id:
         return get_location(loc_id)
     return None
+
+
+def get_csrf_token() -> str:
+    """Return the session's CSRF token, creating it on first use."""
+    token = session.get("csrf_token")
+    if not token:
+        token = secrets.token_urlsafe(24)
+        session["csrf_token"] = token
+    return token
+
+
+def conditional_response(response: Response, etag: Optional[str] = None) -> Response:
+    """Tag *response* with an ETag and answer a matching ``If-None-Match`` with 304.
+
+    Pages and forecast payloads depend on the session (location, profile),
+    so they are marked private and revalidated on every use: an unchanged
+    response then costs a bodiless 304 instead of the full document.
+    """
+    if etag is None:
+        response.add_etag()
+    else:
+        response.set_etag(etag)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
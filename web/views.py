@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import json as _json
 import logging
 import re
@@ -14,6 +15,7 @@ import requests
 from flask import (
     Blueprint,
     g,
+    make_response,
     redirect,
     render_template,
     request,
@@ -29,16 +31,16 @@ from locations import (
     get_location,
 )
 from domain.forecast import generate_forecast, personalize_forecast, recompute_current_uv
-from services.forecast_refresh import enqueue_forecast_refresh
+from services.forecast_refresh import enqueue_forecast_refresh, watch_forecast
 from storage.cache import (
-    CACHE_MAX_AGE_HOURS,
     _forecast_age_minutes,
     _human_age,
+    _max_age_minutes,
     load_cached_forecast,
     save_forecast,
 )
 from storage.sqlite import get_preferences, save_preferences
-from web.helpers import get_session_location
+from web.helpers import conditional_response, get_session_location
 
 bp = Blueprint("views", __name__)
 logger = logging.getLogger(__name__)
@@ -252,15 +254,56 @@ def _extract_profile_from_request() -> Optional[Dict[str, Any]]:
     return profile
 
 
-def _render_forecast(location: Dict[str, Any], cached_flag: Optional[str] = None) -> str:
-    """Load (or refresh) the forecast for a location and render the dashboard."""
+def _dashboard_etag(
+    forecast: Dict[str, Any],
+    cached_flag: Optional[str],
+    profile: Dict[str, Any],
+    wind_units: str,
+) -> str:
+    """Return an ETag for a rendered dashboard without hashing the page.
+
+    ``generated_at`` stands in for the cached forecast body; the rest are
+    the per-request values layered on top of it when the page is rendered.
+    """
+    user = getattr(g, "user", None)
+    cams = [(cam.get("url"), cam.get("status_label")) for cam in forecast.get("nearby_live_cams") or []]
+    key = _json.dumps(
+        [
+            forecast.get("location_id"),
+            forecast.get("generated_at"),
+            forecast.get("age_human"),
+            forecast.get("uv"),
+            session.get("csrf_token"),
+            user["username"] if user else None,
+            profile,
+            wind_units,
+            cached_flag,
+            cams,
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def _render_forecast(
+    location: Dict[str, Any],
+    cached_flag: Optional[str] = None,
+    conditional: bool = False,
+) -> str:
+    """Load (or refresh) the forecast for a location and render the dashboard.
+
+    With *conditional*, the page is returned as a revalidating response
+    that answers a matching ``If-None-Match`` with 304.
+    """
     loc_id = location["id"]
+    watch_forecast(loc_id, user_id=None)
     forecast = load_cached_forecast(loc_id, user_id=None, include_stale=True)
 
     is_stale = False
     if forecast:
         age = _forecast_age_minutes(forecast)
-        is_stale = bool(age is not None and age > CACHE_MAX_AGE_HOURS * 60)
+        is_stale = bool(age is not None and age > _max_age_minutes(forecast))
 
     if forecast is None:
         logger.info("cache.miss location_id=%s", loc_id)
@@ -296,7 +339,8 @@ def _render_forecast(location: Dict[str, Any], cached_flag: Optional[str] = None
     if profile:
         forecast = personalize_forecast(forecast, profile, location)
 
-    _apply_wind_unit_preference(forecast, user_prefs.get("wind_units", "knots"))
+    wind_units = user_prefs.get("wind_units", "knots")
+    _apply_wind_unit_preference(forecast, wind_units)
 
     forecast.update(_build_live_cam_context(location, profile))
 
@@ -323,13 +367,18 @@ def _render_forecast(location: Dict[str, Any], cached_flag: Optional[str] = None
     if profile:
         client_profile.update(profile)
 
-    return render_template(
+    html = render_template(
         "index.html",
         forecast=forecast,
         cached=cached_flag,
         share_id=loc_id,
         profile=client_profile,
     )
+    if not conditional:
+        return html
+    # Rendering creates the session's CSRF token, so the ETag comes after it.
+    etag = _dashboard_etag(forecast, cached_flag, client_profile, wind_units)
+    return conditional_response(make_response(html), etag)
 
 
 @bp.route("/")
@@ -340,7 +389,7 @@ def index() -> str:
         return redirect(url_for("views.setup"))
 
     cached_flag = request.args.get("cached")
-    return _render_forecast(location, cached_flag)
+    return _render_forecast(location, cached_flag, conditional=True)
 
 
 